@@ -0,0 +1,202 @@
+import gzip
+import os
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from dotenv import load_dotenv
+from nutrition_tracker.partitions import add_months
+from upgrade_db import USER_OFFSET_SQL, get_connection
+
+load_dotenv()
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS") or 365)
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR") or "archive"
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE") or 5000)
+
+ARCHIVED_TABLES = ("food_log", "water_log")
+
+
+def get_cutoff():
+    today = datetime.now(timezone.utc).date()
+    return datetime.combine(
+        today - timedelta(days=ARCHIVE_AFTER_DAYS), time.min, timezone.utc
+    )
+
+
+EXCLUDED_DAYS_FILTER = """
+    NOT EXISTS (
+        SELECT 1 FROM archive_excluded_days e
+        WHERE e.user_id = {table_name}.user_id
+          AND {table_name}.date >= e.starts_at
+          AND {table_name}.date < e.ends_at
+    )
+"""
+
+
+def find_days_without_summary(cursor, cutoff):
+    logs = " UNION ALL ".join(
+        f"SELECT user_id, date FROM {table_name} WHERE date < %(cutoff)s"
+        for table_name in ARCHIVED_TABLES
+    )
+    cursor.execute("DROP TABLE IF EXISTS archive_excluded_days")
+    cursor.execute(
+        f"""
+        CREATE TEMP TABLE archive_excluded_days AS
+        SELECT d.user_id, d.day,
+               (d.day - d.day_offset) AT TIME ZONE 'UTC' AS starts_at,
+               (d.day + 1 - d.day_offset) AT TIME ZONE 'UTC' AS ends_at
+        FROM (
+            SELECT DISTINCT l.user_id, {USER_OFFSET_SQL} AS day_offset,
+                   ((l.date AT TIME ZONE 'UTC') + {USER_OFFSET_SQL})::date AS day
+            FROM ({logs}) l
+            JOIN users u ON u.id = l.user_id
+        ) d
+        WHERE NOT EXISTS (
+            SELECT 1 FROM daily_summary ds
+            WHERE ds.user_id = d.user_id
+              AND ds.day BETWEEN d.day - 1 AND d.day + 1
+        )
+        """,
+        {"cutoff": cutoff},
+    )
+    cursor.execute(
+        "SELECT user_id, day FROM archive_excluded_days ORDER BY user_id, day"
+    )
+    return cursor.fetchall()
+
+
+def get_archive_path(table_name, month_start):
+    return os.path.join(ARCHIVE_DIR, f"{table_name}_{month_start:%Y_%m}.csv.gz")
+
+
+def export_rows(cursor, table_name, month_start, query):
+    path = get_archive_path(table_name, month_start)
+    header = "" if os.path.exists(path) else " HEADER"
+    with gzip.open(path, "at", encoding="utf-8", newline="") as archive:
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV{header}", archive)
+    return path
+
+
+def get_expired_partitions(cursor, table_name, cutoff):
+    cursor.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = %s::regclass ORDER BY c.relname",
+        (table_name,),
+    )
+    expired = []
+    for (partition_name,) in cursor.fetchall():
+        match = re.fullmatch(rf"{table_name}_(\d{{4}})_(\d{{2}})", partition_name)
+        if not match:
+            continue
+        month_start = date(int(match.group(1)), int(match.group(2)), 1)
+        month_end = add_months(month_start, 1)
+        if month_end <= cutoff.date() and not has_excluded_days(
+            cursor, month_start, month_end
+        ):
+            expired.append((partition_name, month_start))
+    return expired
+
+
+def has_excluded_days(cursor, month_start, month_end):
+    cursor.execute(
+        "SELECT 1 FROM archive_excluded_days WHERE starts_at < %s AND ends_at > %s",
+        (
+            datetime.combine(month_end, time.min, timezone.utc),
+            datetime.combine(month_start, time.min, timezone.utc),
+        ),
+    )
+    return cursor.fetchone() is not None
+
+
+def archive_partition(cursor, table_name, partition_name, month_start):
+    path = export_rows(
+        cursor,
+        table_name,
+        month_start,
+        f"SELECT * FROM {partition_name} ORDER BY date",
+    )
+    cursor.execute(f"ALTER TABLE {table_name} DETACH PARTITION {partition_name}")
+    cursor.execute(f"DROP TABLE {partition_name}")
+    print(f"Archived {partition_name} to {path} and dropped the partition.")
+
+
+def archive_id_range(cursor, table_name, low, high, cutoff):
+    excluded_days_filter = EXCLUDED_DAYS_FILTER.format(table_name=table_name)
+    cursor.execute(
+        f"""
+        SELECT DISTINCT date_trunc('month', date AT TIME ZONE 'UTC')::date
+        FROM {table_name}
+        WHERE id >= %s AND id < %s AND date < %s AND {excluded_days_filter}
+        """,
+        (low, high, cutoff),
+    )
+    for (month_start,) in sorted(cursor.fetchall()):
+        start = datetime.combine(month_start, time.min, timezone.utc)
+        end = min(
+            datetime.combine(add_months(month_start, 1), time.min, timezone.utc),
+            cutoff,
+        )
+        query = cursor.mogrify(
+            f"SELECT * FROM {table_name} "
+            "WHERE id >= %s AND id < %s AND date >= %s AND date < %s "
+            f"AND {excluded_days_filter} ORDER BY id",
+            (low, high, start, end),
+        ).decode()
+        export_rows(cursor, table_name, month_start, query)
+
+    cursor.execute(
+        f"DELETE FROM {table_name} "
+        f"WHERE id >= %s AND id < %s AND date < %s AND {excluded_days_filter}",
+        (low, high, cutoff),
+    )
+    return cursor.rowcount
+
+
+def archive_rows(cursor, table_name, cutoff):
+    cursor.execute(
+        f"SELECT min(id), max(id) FROM {table_name} WHERE date < %s", (cutoff,)
+    )
+    min_id, max_id = cursor.fetchone()
+    if min_id is None:
+        return
+
+    archived = 0
+    for low in range(min_id, max_id + 1, ARCHIVE_BATCH_SIZE):
+        archived += archive_id_range(
+            cursor, table_name, low, low + ARCHIVE_BATCH_SIZE, cutoff
+        )
+    print(f"Archived {archived} remaining rows of {table_name} to {ARCHIVE_DIR}.")
+
+
+def archive_table(cursor, table_name, cutoff):
+    for partition_name, month_start in get_expired_partitions(
+        cursor, table_name, cutoff
+    ):
+        archive_partition(cursor, table_name, partition_name, month_start)
+    archive_rows(cursor, table_name, cutoff)
+
+
+def archive_logs():
+    cutoff = get_cutoff()
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SET TIME ZONE 'UTC'")
+
+    excluded_days = find_days_without_summary(cursor, cutoff)
+    for user_id, day in excluded_days:
+        print(f"User {user_id} has no daily summary around {day}, skipping that day.")
+
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    for table_name in ARCHIVED_TABLES:
+        archive_table(cursor, table_name, cutoff)
+
+    cursor.close()
+    conn.close()
+    print(f"Logs before {cutoff:%Y-%m-%d} have been archived to {ARCHIVE_DIR}.")
+    if excluded_days:
+        print(f"{len(excluded_days)} user days without a daily summary were kept.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    archive_logs()
@@ -0,0 +1,161 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from aiogram import Bot, Dispatcher, types
+from fake_telegram import build_update
+from nutrition_tracker.bot import bot
+from nutrition_tracker.database import engine, init_db
+from nutrition_tracker.handlers import dp
+from nutrition_tracker.i18n import translations
+from nutrition_tracker.services import start_background_tasks, stop_background_tasks
+
+DEFAULT_MIX = "food=5,water=3,log=1,progress=2,reset=0.2"
+
+ERROR_REPLIES = {messages["error_occurred"] for messages in translations.values()}
+
+
+class ReplyRecorder:
+    def __init__(self):
+        self.replies = 0
+        self.errors = 0
+
+    async def request(self, method, data=None, *args, **kwargs):
+        self.replies += 1
+        if data.get("text") in ERROR_REPLIES:
+            self.errors += 1
+        return {
+            "message_id": self.replies,
+            "date": int(time.time()),
+            "chat": {"id": data.get("chat_id"), "type": "private"},
+            "text": data.get("text"),
+        }
+
+
+def parse_mix(mix: str):
+    weights = {}
+    for item in mix.split(","):
+        command, weight = item.split("=")
+        weights[command.strip()] = float(weight)
+    return weights
+
+
+def build_command(command: str):
+    if command == "food":
+        return (
+            f"/food {random.randint(50, 500)} {random.uniform(0, 30):.1f} "
+            f"{random.uniform(0, 30):.1f} {random.uniform(1, 70):.1f} load test"
+        )
+    if command == "water":
+        return f"/water {random.uniform(0.1, 1):.2f}"
+    return f"/{command}"
+
+
+def percentile(quantiles, value: int):
+    return quantiles[value - 1] * 1000
+
+
+async def send(telegram_id: int, text: str, update_id: int, latencies: dict):
+    update = types.Update(**build_update(update_id, telegram_id, text))
+    started = time.perf_counter()
+    try:
+        await dp.process_update(update)
+    finally:
+        latency = time.perf_counter() - started
+        latencies.setdefault(text.split(" ")[0], []).append(latency)
+
+
+async def run_user(telegram_id, commands, first_update_id, latencies, semaphore):
+    async with semaphore:
+        for offset, text in enumerate(commands):
+            await send(telegram_id, text, first_update_id + offset, latencies)
+
+
+async def run_load_test(args):
+    recorder = ReplyRecorder()
+    bot.request = recorder.request
+    Bot.set_current(bot)
+    Dispatcher.set_current(dp)
+
+    await init_db()
+    start_background_tasks()
+
+    random.seed(args.seed)
+    weights = parse_mix(args.mix)
+    users = [args.first_user_id + index for index in range(args.users)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    warmup_latencies = {}
+    await asyncio.gather(
+        *(
+            run_user(
+                telegram_id,
+                ["/start", "/set 2000 150 67 200 2.5"],
+                index * 2,
+                warmup_latencies,
+                semaphore,
+            )
+            for index, telegram_id in enumerate(users)
+        )
+    )
+
+    user_commands = {telegram_id: [] for telegram_id in users}
+    for _ in range(args.updates):
+        command = random.choices(list(weights), weights=list(weights.values()))[0]
+        user_commands[random.choice(users)].append(build_command(command))
+
+    latencies = {}
+    recorder.replies = recorder.errors = 0
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_user(
+                telegram_id,
+                commands,
+                len(users) * 2 + index * args.updates,
+                latencies,
+                semaphore,
+            )
+            for index, (telegram_id, commands) in enumerate(user_commands.items())
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    await stop_background_tasks()
+    await engine.dispose()
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    print(
+        f"{len(all_latencies)} updates from {args.users} users in {elapsed:.2f}s: "
+        f"{len(all_latencies) / elapsed:.1f} updates/s, "
+        f"{recorder.replies} replies, {recorder.errors} errors"
+    )
+    print(f"{'command':>10} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for command, values in sorted(latencies.items()) + [("all", all_latencies)]:
+        if len(values) < 2:
+            continue
+        quantiles = statistics.quantiles(values, n=100)
+        print(
+            f"{command:>10} {len(values):>7} {percentile(quantiles, 50):>8.1f} "
+            f"{percentile(quantiles, 95):>8.1f} {percentile(quantiles, 99):>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay synthetic Telegram updates through the dispatcher "
+        "against the configured Postgres and Redis."
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--first-user-id", type=int, default=2_100_000_000)
+    args = parser.parse_args()
+    asyncio.run(run_load_test(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import random
+import time
+from nutrition_tracker.nutrition import calculate_needs, calculate_needs_batch
+
+
+def optional(value, probability=0.3):
+    return None if random.random() < probability else value
+
+
+def build_cohort(size, seed):
+    random.seed(seed)
+    cohort = []
+    for _ in range(size):
+        cohort.append(
+            {
+                "age": random.randint(1, 200),
+                "weight": round(random.uniform(1, 1000), 1),
+                "height": round(random.uniform(1, 300), 1),
+                "metabolism": optional(random.randint(1, 10)),
+                "activity": random.randint(0, 10),
+                "goal": random.choice([-1, 0, 1]),
+                "desire": optional(random.randint(1, 10)),
+                "diet_type": random.randint(0, 3),
+                "gender": random.choice(["m", "f", None]),
+                "body_fat": optional(round(random.uniform(0.1, 100), 1)),
+                "climate": random.choice([-1, 0, 1]),
+                "resting_heart_rate": optional(random.randint(40, 140)),
+            }
+        )
+    return cohort
+
+
+def to_columns(cohort):
+    nan = float("nan")
+    columns = {key: [] for key in cohort[0]}
+    for params in cohort:
+        for key, value in params.items():
+            if value is None and key != "gender":
+                value = nan
+            columns[key].append(value)
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that the scalar and batch /calc math agree and time both."
+    )
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cohort = build_cohort(args.size, args.seed)
+    columns = to_columns(cohort)
+
+    started = time.perf_counter()
+    scalar_results = [calculate_needs(**params) for params in cohort]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch_results = calculate_needs_batch(**columns)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = 0
+    for index, scalar in enumerate(scalar_results):
+        batch = [float(column[index]) for column in batch_results]
+        if [float(value) for value in scalar] != batch:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"Mismatch for {cohort[index]}: {scalar} != {batch}")
+
+    print(f"  scalar: {scalar_seconds * 1e9 / args.size:.0f} ns per user")
+    print(f"   batch: {batch_seconds * 1e9 / args.size:.0f} ns per user")
+    print(f"Mismatches: {mismatches} of {args.size}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import subprocess
+import sys
+import time
+
+
+def measure_import(module):
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_seconds = time.perf_counter() - started
+
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports[name.strip()] = (depth, int(self_us), int(cumulative_us))
+    return wall_seconds, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure how long importing the bot takes with -X importtime."
+    )
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail if the median import time of the module exceeds this budget",
+    )
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.repeat)]
+    runs.sort(key=lambda run: run[1][args.module][2])
+    wall_seconds, imports = runs[len(runs) // 2]
+    module_ms = imports[args.module][2] / 1000
+
+    direct_imports = sorted(
+        (
+            (cumulative_us, name)
+            for name, (depth, _, cumulative_us) in imports.items()
+            if depth == 1
+        ),
+        reverse=True,
+    )
+    print(f"Slowest imports of {args.module}:")
+    for cumulative_us, name in direct_imports[: args.top]:
+        print(f"{cumulative_us / 1000:>10.1f} ms  {name}")
+    print(
+        f"{args.module}: {module_ms:.1f} ms to import, {wall_seconds * 1000:.0f} ms wall"
+    )
+
+    if args.budget_ms is not None and module_ms > args.budget_ms:
+        print(f"Import time exceeds the budget of {args.budget_ms:.0f} ms.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import timeit
+from nutrition_tracker.i18n import get_translator, round_value, translations
+
+
+def legacy_get_translation(user_language, key, **kwargs):
+    for k, v in kwargs.items():
+        if isinstance(v, (int, float)):
+            kwargs[k] = round_value(v)
+
+    try:
+        message = translations[user_language][key].format(**kwargs)
+    except KeyError:
+        message = translations["en"][key].format(**kwargs)
+    return message
+
+
+def build_rows(count):
+    return [
+        {
+            "time": "08:15",
+            "calories": 412.345 + i,
+            "protein": 20.12,
+            "fat": 12.34,
+            "carbohydrates": 55.67,
+            "comment": "Porridge",
+        }
+        for i in range(count)
+    ]
+
+
+def format_legacy(language, rows):
+    return [legacy_get_translation(language, "food_entry", **row) for row in rows]
+
+
+def format_compiled(language, rows):
+    translator = get_translator(language)
+    return translator.format_many(("food_entry", dict(row)) for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-row cost of formatting /log entries."
+    )
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--language", default="ru")
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    assert format_legacy(args.language, rows) == format_compiled(args.language, rows)
+
+    for name, formatter in (("legacy", format_legacy), ("compiled", format_compiled)):
+        seconds = min(
+            timeit.repeat(
+                lambda: formatter(args.language, rows), number=args.repeat, repeat=5
+            )
+        )
+        per_row = seconds / (args.repeat * args.rows) * 1e9
+        print(f"{name:>8}: {per_row:.0f} ns per row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from upgrade_db import create_upcoming_partitions, get_connection
+
+
+def create_partitions():
+    conn = get_connection()
+    cursor = conn.cursor()
+    create_upcoming_partitions(cursor)
+    cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    create_partitions()
@@ -0,0 +1,75 @@
+import os
+import time
+import asyncio
+import argparse
+import aiohttp
+from dotenv import load_dotenv
+
+load_dotenv()
+
+WEBAPP_PORT = int(os.getenv("WEBAPP_PORT") or 8080)
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH") or "/webhook"
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+
+
+def build_update(update_id, telegram_id, text):
+    command_length = len(text.split(" ")[0]) if text.startswith("/") else 0
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": telegram_id, "type": "private"},
+        "from": {"id": telegram_id, "is_bot": False, "first_name": "Test"},
+        "text": text,
+    }
+    if command_length:
+        message["entities"] = [
+            {"type": "bot_command", "offset": 0, "length": command_length}
+        ]
+    return {"update_id": update_id, "message": message}
+
+
+async def send_updates(url, text, users, count):
+    headers = {}
+    if WEBHOOK_SECRET:
+        headers["X-Telegram-Bot-Api-Secret-Token"] = WEBHOOK_SECRET
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+
+        async def send(update_id):
+            telegram_id = 1 + update_id % users
+            started = time.perf_counter()
+            async with session.post(
+                url, json=build_update(update_id, telegram_id, text)
+            ) as response:
+                await response.read()
+                return response.status, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(send(i) for i in range(1, count + 1)))
+        elapsed = time.perf_counter() - started
+
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = sorted(latency for _, latency in results)
+    print(f"Sent {count} updates to {url} in {elapsed:.3f}s.")
+    print(f"Status codes: {statuses}")
+    print(f"Median latency: {latencies[len(latencies) // 2] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Send fake Telegram updates to the local webhook server."
+    )
+    parser.add_argument("text", nargs="?", default="/progress")
+    parser.add_argument(
+        "--url", default=f"http://127.0.0.1:{WEBAPP_PORT}{WEBHOOK_PATH}"
+    )
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--count", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(send_updates(args.url, args.text, args.users, args.count))
+
+
+if __name__ == "__main__":
+    main()
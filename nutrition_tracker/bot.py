@@ -0,0 +1,88 @@
+import logging
+from aiogram import Bot, Dispatcher
+from .config import (
+    DEBUG_LEVEL,
+    metrics_host,
+    metrics_port,
+    token,
+    webapp_host,
+    webapp_port,
+    webhook_host,
+    webhook_path,
+    webhook_secret,
+)
+from .database import engine, init_db
+from .services import start_background_tasks, stop_background_tasks
+from .user_context import UserContextMiddleware
+
+logger = logging.getLogger(__name__)
+
+bot = Bot(token=token)
+dp = Dispatcher(bot)
+
+if DEBUG_LEVEL == "DEBUG":
+    from aiogram.contrib.middlewares.logging import LoggingMiddleware
+
+    dp.middleware.setup(LoggingMiddleware())
+
+if metrics_port:
+    from . import metrics
+
+    metrics.setup(dp, engine)
+
+dp.middleware.setup(UserContextMiddleware())
+
+
+async def on_startup(dispatcher):
+    await init_db()
+    start_background_tasks()
+    if metrics_port:
+        metrics.start_server(metrics_port, metrics_host)
+
+
+async def on_shutdown(dispatcher):
+    await stop_background_tasks()
+
+
+async def on_startup_webhook(dispatcher):
+    await init_db()
+    start_background_tasks()
+    if metrics_port:
+        metrics.start_server(metrics_port, metrics_host)
+
+    webhook_url = f"{webhook_host.rstrip('/')}{webhook_path}"
+    webhook_info = await dispatcher.bot.get_webhook_info()
+    await dispatcher.bot.set_webhook(
+        webhook_url,
+        secret_token=webhook_secret,
+        drop_pending_updates=webhook_info.url != webhook_url,
+    )
+    logger.info(f"Webhook set to {webhook_url}.")
+
+
+def start_webhook():
+    import hmac
+    from aiohttp import web
+    from aiogram.utils import executor
+
+    if not webhook_host:
+        raise RuntimeError("WEBHOOK_HOST must be set when RUN_MODE is webhook.")
+
+    @web.middleware
+    async def check_webhook_secret(request, handler):
+        if webhook_secret:
+            token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+            if not hmac.compare_digest(token, webhook_secret):
+                logger.debug(f"Rejected webhook request from {request.remote}.")
+                return web.Response(status=403)
+        return await handler(request)
+
+    web_app = web.Application(middlewares=[check_webhook_secret])
+    webhook_executor = executor.set_webhook(
+        dp,
+        webhook_path,
+        on_startup=on_startup_webhook,
+        on_shutdown=on_shutdown,
+        web_app=web_app,
+    )
+    webhook_executor.run_app(host=webapp_host, port=webapp_port)
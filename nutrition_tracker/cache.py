@@ -0,0 +1,324 @@
+import asyncio
+import logging
+from collections import OrderedDict, namedtuple
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from .config import (
+    calc_memo_redis,
+    calc_memo_size,
+    calc_memo_ttl,
+    progress_cache_ttl,
+    redis_connect_timeout,
+    redis_db,
+    redis_host,
+    redis_password,
+    redis_port,
+    redis_timeout,
+    user_cache_ttl,
+    user_count_reconcile_interval,
+)
+from .database import get_db_session
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+if redis_password:
+    redis_client = redis.Redis(
+        host=redis_host,
+        port=redis_port,
+        password=redis_password,
+        db=redis_db,
+        socket_connect_timeout=redis_connect_timeout,
+        socket_timeout=redis_timeout,
+        decode_responses=True,
+    )
+else:
+    redis_client = redis.Redis(
+        host=redis_host,
+        port=redis_port,
+        db=redis_db,
+        socket_connect_timeout=redis_connect_timeout,
+        socket_timeout=redis_timeout,
+        decode_responses=True,
+    )
+
+
+CachedUser = namedtuple("CachedUser", ["id", "timezone", "language"])
+
+
+def get_user_cache_key(telegram_id: int):
+    return f"user:{telegram_id}"
+
+
+async def get_cached_user(telegram_id: int):
+    try:
+        cached = await redis_client.hgetall(get_user_cache_key(telegram_id))
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while reading user {telegram_id}: {e}")
+        return None
+    if not cached:
+        return None
+    return CachedUser(
+        id=int(cached["id"]),
+        timezone=cached["timezone"],
+        language=cached["language"],
+    )
+
+
+async def cache_user(telegram_id: int, user):
+    key = get_user_cache_key(telegram_id)
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "id": user.id,
+                    "timezone": user.timezone,
+                    "language": user.language,
+                },
+            )
+            pipe.expire(key, user_cache_ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while caching user {telegram_id}: {e}")
+
+
+async def invalidate_cached_user(telegram_id: int):
+    try:
+        await redis_client.delete(get_user_cache_key(telegram_id))
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while invalidating user {telegram_id}: {e}")
+
+
+update_progress_script = redis_client.register_script(
+    """
+    redis.call("INCR", KEYS[2])
+    redis.call("EXPIRE", KEYS[2], ARGV[2])
+    if redis.call("EXISTS", KEYS[1]) == 1 then
+        for i = 3, #ARGV, 2 do
+            redis.call(ARGV[1], KEYS[1], ARGV[i], ARGV[i + 1])
+        end
+    end
+    """
+)
+
+fill_progress_script = redis_client.register_script(
+    """
+    if (redis.call("GET", KEYS[2]) or "0") ~= ARGV[1] then
+        return 0
+    end
+    for i = 3, #ARGV, 2 do
+        redis.call("HSET", KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+    redis.call("EXPIRE", KEYS[1], ARGV[2])
+    return 1
+    """
+)
+
+
+def get_progress_cache_key(user_id: int, day):
+    return f"progress:{user_id}:{day.isoformat()}"
+
+
+def get_progress_version_key(user_id: int, day):
+    return f"progress_version:{user_id}:{day.isoformat()}"
+
+
+async def get_cached_progress(user_id: int, day):
+    try:
+        cached = await redis_client.hgetall(get_progress_cache_key(user_id, day))
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while reading progress of {user_id}: {e}")
+        return None
+    if not cached:
+        return None
+    return {field: float(value) for field, value in cached.items()}
+
+
+async def get_progress_version(user_id: int, day):
+    try:
+        version = await redis_client.get(get_progress_version_key(user_id, day))
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while reading progress of {user_id}: {e}")
+        return None
+    return version or "0"
+
+
+async def cache_progress(user_id: int, day, progress: dict, version: str):
+    args = [version, progress_cache_ttl]
+    for field, value in progress.items():
+        args.extend((field, value))
+    try:
+        filled = await fill_progress_script(
+            keys=[
+                get_progress_cache_key(user_id, day),
+                get_progress_version_key(user_id, day),
+            ],
+            args=args,
+        )
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while caching progress of {user_id}: {e}")
+        return
+    if not filled:
+        logger.debug(f"Progress of {user_id} changed while loading, not caching it.")
+
+
+async def update_cached_progress(user_id: int, day, command: str, **fields):
+    args = [command, progress_cache_ttl]
+    for field, value in fields.items():
+        args.extend((field, value))
+    try:
+        await update_progress_script(
+            keys=[
+                get_progress_cache_key(user_id, day),
+                get_progress_version_key(user_id, day),
+            ],
+            args=args,
+        )
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while updating progress of {user_id}: {e}")
+        await invalidate_cached_progress(user_id, day)
+
+
+async def invalidate_cached_progress(user_id: int, day):
+    version_key = get_progress_version_key(user_id, day)
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(version_key)
+            pipe.expire(version_key, progress_cache_ttl)
+            pipe.delete(get_progress_cache_key(user_id, day))
+            await pipe.execute()
+    except RedisError as e:
+        logger.debug(f"Redis unavailable while invalidating progress of {user_id}: {e}")
+
+
+class CalcMemo:
+    def __init__(self, max_size: int, use_redis: bool, ttl: int):
+        self.max_size = max_size
+        self.use_redis = use_redis
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def get_redis_key(self, key):
+        language, params = key
+        return "calc:" + language + ":" + ":".join(str(value) for value in params)
+
+    def remember(self, key, value: str):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def get(self, key):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        if self.use_redis:
+            try:
+                value = await redis_client.get(self.get_redis_key(key))
+            except RedisError as e:
+                logger.debug(f"Redis unavailable while reading /calc memo: {e}")
+            if value is not None:
+                self.remember(key, value)
+                self.redis_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key, value: str):
+        self.remember(key, value)
+        if self.use_redis:
+            try:
+                await redis_client.set(self.get_redis_key(key), value, ex=self.ttl)
+            except RedisError as e:
+                logger.debug(f"Redis unavailable while writing /calc memo: {e}")
+
+
+calc_memo = CalcMemo(calc_memo_size, calc_memo_redis, calc_memo_ttl)
+
+
+increment_if_exists_script = redis_client.register_script(
+    """
+    if redis.call("EXISTS", KEYS[1]) == 1 then
+        return redis.call("INCR", KEYS[1])
+    end
+    """
+)
+
+
+class UserCounter:
+    def __init__(self, key: str, reconcile_interval: int):
+        self.key = key
+        self.lock_key = f"{key}:reconcile"
+        self.reconcile_interval = reconcile_interval
+        self.task = None
+
+    async def count_users(self, session):
+        result = await session.execute(select(func.count(User.id)))
+        return result.scalar()
+
+    async def get(self, session):
+        try:
+            count = await redis_client.get(self.key)
+        except RedisError as e:
+            logger.debug(f"Redis unavailable while reading user count: {e}")
+            return await self.count_users(session)
+        if count is not None:
+            return int(count)
+
+        count = await self.count_users(session)
+        try:
+            await redis_client.set(self.key, count, nx=True)
+        except RedisError as e:
+            logger.debug(f"Redis unavailable while caching user count: {e}")
+        return count
+
+    async def increment(self):
+        try:
+            await increment_if_exists_script(keys=[self.key])
+        except RedisError as e:
+            logger.debug(f"Redis unavailable while incrementing user count: {e}")
+
+    async def reconcile(self):
+        try:
+            locked = await redis_client.set(
+                self.lock_key, 1, nx=True, ex=self.reconcile_interval
+            )
+            if not locked:
+                return
+            async with get_db_session() as session:
+                count = await self.count_users(session)
+            await redis_client.set(self.key, count)
+            logger.debug(f"Reconciled user count to {count}.")
+        except RedisError as e:
+            logger.debug(f"Redis unavailable while reconciling user count: {e}")
+
+    async def run(self):
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"Failed to reconcile user count: {e}")
+            await asyncio.sleep(self.reconcile_interval)
+
+    def start(self):
+        if self.task is None and self.reconcile_interval > 0:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+
+user_counter = UserCounter("user_count", user_count_reconcile_interval)
@@ -0,0 +1,63 @@
+import os
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEBUG_LEVEL = os.getenv("DEBUG_LEVEL").upper()
+
+logging.basicConfig(level=getattr(logging, DEBUG_LEVEL, logging.INFO))
+
+token = os.getenv("TOKEN")
+
+db_user = os.getenv("DB_USER")
+db_password = os.getenv("DB_PASSWORD")
+db_host = os.getenv("DB_HOST")
+db_port = os.getenv("DB_PORT")
+db_name = os.getenv("DB_NAME")
+
+if db_password:
+    DATABASE_URL = (
+        f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+    )
+else:
+    DATABASE_URL = f"postgresql+asyncpg://{db_user}@{db_host}:{db_port}/{db_name}"
+
+pool_size = int(os.getenv("DB_POOL_SIZE"))
+max_overflow = int(os.getenv("DB_MAX_OVERFLOW"))
+
+redis_host = os.getenv("REDIS_HOST")
+redis_port = int(os.getenv("REDIS_PORT"))
+redis_password = os.getenv("REDIS_PASSWORD")
+redis_db = int(os.getenv("REDIS_DB"))
+redis_connect_timeout = float(os.getenv("REDIS_CONNECT_TIMEOUT") or 1)
+redis_timeout = float(os.getenv("REDIS_TIMEOUT") or 1)
+
+user_cache_ttl = int(os.getenv("USER_CACHE_TTL") or 3600)
+progress_cache_ttl = int(os.getenv("PROGRESS_CACHE_TTL") or 172800)
+
+calc_memo_size = int(os.getenv("CALC_MEMO_SIZE") or 1024)
+calc_memo_redis = (os.getenv("CALC_MEMO_REDIS") or "").lower() in ("1", "true")
+calc_memo_ttl = int(os.getenv("CALC_MEMO_TTL") or 86400)
+
+write_behind_enabled = (os.getenv("WRITE_BEHIND") or "").lower() in ("1", "true")
+write_behind_interval_ms = int(os.getenv("WRITE_BEHIND_INTERVAL_MS") or 200)
+write_behind_batch_size = int(os.getenv("WRITE_BEHIND_BATCH_SIZE") or 500)
+
+user_count_reconcile_interval = int(os.getenv("USER_COUNT_RECONCILE_INTERVAL") or 3600)
+
+metrics_port = int(os.getenv("METRICS_PORT") or 0)
+metrics_host = os.getenv("METRICS_HOST") or "127.0.0.1"
+
+schema_mode = (os.getenv("SCHEMA_MODE") or "create").lower()
+partition_months_ahead = int(os.getenv("PARTITION_MONTHS_AHEAD") or 3)
+
+run_mode = (os.getenv("RUN_MODE") or "polling").lower()
+webhook_host = os.getenv("WEBHOOK_HOST")
+webhook_path = os.getenv("WEBHOOK_PATH") or "/webhook"
+webhook_secret = os.getenv("WEBHOOK_SECRET")
+webapp_host = os.getenv("WEBAPP_HOST") or "0.0.0.0"
+webapp_port = int(os.getenv("WEBAPP_PORT") or 8080)
+
+if write_behind_enabled and run_mode == "webhook":
+    raise RuntimeError("WRITE_BEHIND cannot be used when RUN_MODE is webhook.")
@@ -0,0 +1,86 @@
+import logging
+from contextlib import asynccontextmanager
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import func
+from .config import (
+    DATABASE_URL,
+    DEBUG_LEVEL,
+    max_overflow,
+    partition_months_ahead,
+    pool_size,
+    schema_mode,
+)
+from .models import Base, SchemaVersion, User
+from .partitions import build_upcoming_partitions_ddl
+from .schema import SCHEMA_VERSION
+from .timezones import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=(DEBUG_LEVEL == "DEBUG"),
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+)
+
+async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def get_db_session():
+    async with async_session() as session:
+        yield session
+
+
+async def get_schema_version(conn):
+    has_table = await conn.run_sync(
+        lambda sync_conn: inspect(sync_conn).has_table(SchemaVersion.__tablename__)
+    )
+    if not has_table:
+        return None
+    result = await conn.execute(select(func.max(SchemaVersion.version)))
+    return result.scalar()
+
+
+def check_schema_version(version):
+    if version is None or version < SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version is {version}, expected {SCHEMA_VERSION}. "
+            "Run upgrade_db.py."
+        )
+
+
+async def init_db():
+    if schema_mode == "verify":
+        await verify_schema()
+        return
+
+    async with engine.begin() as conn:
+        is_new_database = not await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(User.__tablename__)
+        )
+        if not is_new_database:
+            check_schema_version(await get_schema_version(conn))
+        await conn.run_sync(Base.metadata.create_all)
+        for ddl in build_upcoming_partitions_ddl(
+            get_utc_now().date(), partition_months_ahead
+        ):
+            await conn.exec_driver_sql(ddl)
+        if is_new_database:
+            await conn.execute(
+                pg_insert(SchemaVersion)
+                .values(version=SCHEMA_VERSION)
+                .on_conflict_do_nothing()
+            )
+
+
+async def verify_schema():
+    async with engine.connect() as conn:
+        version = await get_schema_version(conn)
+    check_schema_version(version)
+    logger.info(f"Database schema version {version} verified.")
@@ -0,0 +1,403 @@
+import logging
+from aiogram import types
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import services
+from .bot import dp
+from .cache import CachedUser, calc_memo
+from .i18n import get_translation, get_translator, round_value
+from .nutrition import calculate_needs, parse_calc_params
+from .services import ValidationError
+from .timezones import get_user_timezone
+from .user_context import handle_error
+
+logger = logging.getLogger(__name__)
+
+
+MESSAGE_LENGTH_LIMIT = 4096
+
+
+class MessageChunker:
+    def __init__(self, limit: int = MESSAGE_LENGTH_LIMIT):
+        self.limit = limit
+        self.lines = []
+        self.length = 0
+
+    def add(self, line: str):
+        pages = []
+        for start in range(0, max(len(line), 1), self.limit):
+            piece = line[start : start + self.limit]
+            if self.lines and self.length + 1 + len(piece) > self.limit:
+                pages.append(self.flush())
+            self.length += len(piece) + (1 if self.lines else 0)
+            self.lines.append(piece)
+        return pages
+
+    def flush(self):
+        page = "\n".join(self.lines)
+        self.lines = []
+        self.length = 0
+        return page
+
+
+@dp.message_handler(commands=["start"])
+async def start_command(message: types.Message, user: CachedUser):
+    logger.debug(f"User {message.from_user.id} issued /start command.")
+    await message.reply(get_translation(user.language, "start"))
+
+
+@dp.message_handler(commands=["set"])
+async def set_info(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(
+        f"User {message.from_user.id} issued /set command with data: {message.text}"
+    )
+    try:
+        data = message.text.split(" ")[1:]
+        if len(data) != 5:
+            await message.reply(get_translation(user.language, "set_info_usage"))
+            return
+
+        try:
+            await services.set_targets(session, user, *data)
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        await message.reply(get_translation(user.language, "data_updated"))
+    except Exception as e:
+        logger.debug(f"Error in set_info: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["food"])
+async def add_food(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(
+        f"User {message.from_user.id} issued /food command with data: {message.text}"
+    )
+    try:
+        data = message.text.split(" ")[1:]
+        if len(data) < 4:
+            await message.reply(get_translation(user.language, "add_food_usage"))
+            return
+
+        try:
+            food = await services.log_food(
+                session, user, *data[:4], comment=" ".join(data[4:])
+            )
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        await message.reply(
+            get_translation(
+                user.language, "food_added", calories=round_value(food["calories"])
+            )
+        )
+    except Exception as e:
+        logger.debug(f"Error in add_food: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["water"])
+async def add_water(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(
+        f"User {message.from_user.id} issued /water command with data: {message.text}"
+    )
+    try:
+        data = message.text.split(" ")
+        if len(data) != 2:
+            await message.reply(get_translation(user.language, "add_water_usage"))
+            return
+
+        try:
+            water = await services.log_water(session, user, data[1])
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        await message.reply(
+            get_translation(
+                user.language, "water_added", water=round_value(water["water"])
+            )
+        )
+    except Exception as e:
+        logger.debug(f"Error in add_water: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["time"])
+async def set_timezone(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(
+        f"User {message.from_user.id} issued /time command with data: {message.text}"
+    )
+    try:
+        data = message.text.split(" ")
+        if len(data) != 2:
+            await message.reply(get_translation(user.language, "set_timezone_usage"))
+            return
+
+        timezone = data[1]
+        try:
+            await services.set_timezone(session, message.from_user.id, user, timezone)
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        await message.reply(
+            get_translation(user.language, "timezone_set", timezone=timezone)
+        )
+    except Exception as e:
+        logger.debug(f"Error in set_timezone: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["lang"])
+async def set_language(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(
+        f"User {message.from_user.id} issued /lang command with data: {message.text}"
+    )
+    try:
+        data = message.text.split(" ")
+        if len(data) != 2:
+            await message.reply(get_translation(user.language, "set_language_usage"))
+            return
+
+        language = data[1]
+        try:
+            await services.set_language(session, message.from_user.id, user, language)
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        await message.reply(
+            get_translation(language, "language_changed", language=language)
+        )
+    except Exception as e:
+        logger.debug(f"Error in set_language: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["log"])
+async def get_daily_log(
+    message: types.Message, user: CachedUser, session: AsyncSession
+):
+    logger.debug(
+        f"User {message.from_user.id} issued /log command with data: {message.text}"
+    )
+
+    try:
+        data = message.text.split(" ")
+        if len(data) > 2:
+            await message.reply(get_translation(user.language, "get_daily_log_usage"))
+            return
+
+        try:
+            target_date = services.get_target_date(user, *data[1:])
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        user_timezone = get_user_timezone(user.timezone)
+        translator = get_translator(user.language)
+        time_format = "%I:%M %p" if user.language == "en" else "%H:%M"
+
+        chunker = MessageChunker()
+        has_entries = False
+        async for rows in services.iter_daily_log(session, user, target_date):
+            if not has_entries:
+                has_entries = True
+                chunker.add(
+                    translator.format("daily_food_and_water_log", date=target_date)
+                )
+
+            entries = []
+            for row in rows:
+                time_str = row.date.astimezone(user_timezone).strftime(time_format)
+                if row.type == "food":
+                    entries.append(
+                        (
+                            "food_entry",
+                            {
+                                "time": time_str,
+                                "calories": row.calories,
+                                "protein": row.protein,
+                                "fat": row.fat,
+                                "carbohydrates": row.carbohydrates,
+                                "comment": row.comment if row.comment else "-",
+                            },
+                        )
+                    )
+                else:
+                    entries.append(
+                        ("water_entry", {"time": time_str, "water": row.water})
+                    )
+
+            for line in translator.format_many(entries):
+                for page in chunker.add(line):
+                    await message.reply(page)
+
+        if has_entries:
+            await message.reply(chunker.flush())
+        else:
+            await message.reply(get_translation(user.language, "no_data_for_date"))
+
+    except Exception as e:
+        logger.debug(f"Error in get_daily_log: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["calc"])
+async def calculate_info(message: types.Message, user: CachedUser):
+    logger.debug(
+        f"User {message.from_user.id} issued /calc command with data: {message.text}"
+    )
+
+    try:
+        data = message.text.split(" ")[1:]
+        params, error_key = parse_calc_params(data)
+        if error_key:
+            await message.reply(get_translation(user.language, error_key))
+            return
+
+        memo_key = (user.language, params)
+        auto_update_message = await calc_memo.get(memo_key)
+        if auto_update_message is None:
+            needs = calculate_needs(*params)
+            update_command = f"/set {round_value(int(needs.tdee))} {round_value(needs.protein)} {round_value(needs.fat)} {round_value(needs.carbohydrates)} {round_value(needs.water)}"
+            auto_update_message = get_translation(
+                user.language,
+                "auto_update_info",
+                command=f"```copy\n{update_command}\n```",
+            )
+            await calc_memo.set(memo_key, auto_update_message)
+
+        await message.reply(auto_update_message, parse_mode="Markdown")
+    except Exception as e:
+        logger.debug(f"Error in calculate_info: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["get"])
+async def get_info(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(f"User {message.from_user.id} issued /get command.")
+    try:
+        info_log = await services.get_targets(session, user)
+        if not info_log:
+            await message.reply(get_translation(user.language, "enter_data_first"))
+            return
+
+        info_message = get_translation(
+            user.language,
+            "current_info_message",
+            calories=round_value(info_log.calories),
+            protein=round_value(info_log.protein),
+            fat=round_value(info_log.fat),
+            carbohydrates=round_value(info_log.carbohydrates),
+            water=round_value(info_log.water),
+        )
+        await message.reply(info_message)
+    except Exception as e:
+        logger.debug(f"Error in get_info: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["count"])
+async def user_count(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(f"User {message.from_user.id} issued /count command.")
+
+    try:
+        user_count = await services.count_users(session)
+
+        await message.reply(
+            get_translation(user.language, "user_count_message", count=user_count)
+        )
+    except Exception as e:
+        logger.debug(f"Error in user_count: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["progress"])
+async def get_daily_progress(
+    message: types.Message, user: CachedUser, session: AsyncSession
+):
+    logger.debug(f"User {message.from_user.id} issued /progress command.")
+
+    try:
+        data = message.text.split(" ")
+        if len(data) > 2:
+            await message.reply(
+                get_translation(user.language, "get_daily_progress_usage")
+            )
+            return
+
+        try:
+            target_date = services.get_target_date(user, *data[1:])
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        progress = await services.get_progress(session, user, target_date)
+        if not progress:
+            await message.reply(get_translation(user.language, "no_data_for_date"))
+            return
+
+        values = {**progress, **services.get_remaining(progress)}
+        progress_message = get_translation(
+            user.language,
+            "daily_progress_message",
+            date=target_date,
+            **{key: round_value(value) for key, value in values.items()},
+        )
+
+        await message.reply(progress_message)
+
+    except Exception as e:
+        logger.debug(f"Error in get_daily_progress: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["stats"])
+async def get_stats(message: types.Message, user: CachedUser, session: AsyncSession):
+    logger.debug(f"User {message.from_user.id} issued /stats command.")
+
+    try:
+        data = message.text.split(" ")
+        if len(data) > 2:
+            await message.reply(get_translation(user.language, "stats_usage"))
+            return
+
+        try:
+            stats = await services.get_stats(session, user, *data[1:])
+        except ValidationError as e:
+            await message.reply(get_translation(user.language, e.key))
+            return
+
+        if not stats:
+            await message.reply(get_translation(user.language, "no_data_for_period"))
+            return
+
+        period = stats.pop("period")
+        await message.reply(
+            get_translation(
+                user.language,
+                f"{period}_stats_message",
+                **{key: round_value(value) for key, value in stats.items()},
+            )
+        )
+
+    except Exception as e:
+        logger.debug(f"Error in get_stats: {e}")
+        await handle_error(message)
+
+
+@dp.message_handler(commands=["reset"])
+async def reset_daily_progress(
+    message: types.Message, user: CachedUser, session: AsyncSession
+):
+    logger.debug(f"User {message.from_user.id} issued /reset command.")
+    try:
+        await services.reset_progress(session, user)
+        await message.reply(get_translation(user.language, "data_updated"))
+
+    except Exception as e:
+        logger.debug(f"Error in reset_daily_progress: {e}")
+        await handle_error(message)
@@ -0,0 +1,282 @@
+import string
+import logging
+
+logger = logging.getLogger(__name__)
+
+translations = {
+    "en": {
+        "start": "Hello! I will help you track calories and water. Enter your data with /set.",
+        "data_updated": "Data updated successfully!",
+        "enter_data_first": "Please enter your information first using /set.",
+        "invalid_calories": "Invalid number of calories. Please enter a value between 10 and 100000.",
+        "invalid_protein_fat_carbs": "Invalid amount of protein, fat, or carbs. Each should be between 0 and 100000.",
+        "invalid_water": "Invalid amount of water. Please enter a value between 0.1 and 100 liters.",
+        "calories_mismatch": "The total calories from protein, fat, and carbs do not match the provided calories.",
+        "water_added": "You have added {water} liters of water.",
+        "food_added": "You have added food with {calories} calories.",
+        "invalid_timezone": "Invalid timezone format. Please use UTC±HH or UTC±HH:MM format. Examples: UTC+03, UTC-02, UTC+05:30.",
+        "timezone_set": "Timezone set to {timezone}.",
+        "invalid_language": "Invalid language. Only 'en' and 'ru' are available.",
+        "language_changed": "Language changed to {language}.",
+        "no_data_for_date": "No data for the specified date.",
+        "invalid_comment": "The comment must be less than 100 characters.",
+        "error_occurred": "An error occurred.",
+        "set_info_usage": "Usage: /set <calories> <protein> <fat> <carbs> <water>. Example: /set 2000 150 50 250 2.5",
+        "add_food_usage": (
+            "Usage: /food <grams_eaten> <protein_per_100g> <fat_per_100g> <carbs_per_100g> [comment].\n"
+            "Example: /food 150 10 5 20 Delicious porridge."
+        ),
+        "set_timezone_usage": "Usage: /time <timezone>. Examples: /time UTC+03, /time UTC-05:30",
+        "set_language_usage": "Usage: /lang <en/ru>. Example: /lang ru",
+        "add_water_usage": "Usage: /water <liters>. Example: /water 2.5",
+        "get_daily_log_usage": "Usage: /log [date]. Example: /log 2023-10-15",
+        "invalid_date_format": "Invalid date format. Please use YYYY-MM-DD.",
+        "food_entry": "[{time}] Food: {calories} kcal, P: {protein}, F: {fat}, C: {carbohydrates}, Comment: {comment}",
+        "water_entry": "[{time}] Water: {water} liters",
+        "calculate_info_usage": (
+            "Usage: /calc <age> <weight> <height> <metabolism> <activity> <goal> <desire> <diet_type> <gender> <body_fat> <climate> <rhr>.\n\n"
+            "Parameters:\n"
+            "- age: Integer between 1 and 200.\n"
+            "- weight: Float between 1 and 1000 (kg).\n"
+            "- height: Float between 1 and 1000 (cm).\n"
+            "- metabolism: Integer between 1 and 10 or '-' (optional).\n"
+            "- activity: Integer between 0 and 10 or '-' (optional).\n"
+            "- goal: Integer -1 (lose weight), 0 (maintain weight), +1 (gain weight), or '-' (optional).\n"
+            "- desire: Integer between 1 and 10 or '-' (how strongly you want to lose/gain weight). If '-', it won't be considered.\n"
+            "- diet_type: Integer 0 (basic), 1 (protein), 2 (fat), 3 (carbohydrate), or '-' (optional).\n"
+            "- gender: 'm' for male, 'f' for female, or '-' (optional).\n"
+            "- body_fat: Float between 0.1 and 100 or '-' (optional).\n"
+            "- climate: Integer -1 (cold), 0 (humid), 1 (hot), or '-' (optional).\n"
+            "- rhr: Resting Heart Rate, integer between 40 and 140, or '-' (optional).\n\n"
+            "Examples:\n"
+            "/calc 30 70 175 5 5 -1 7 1 m 20 0 70\n"
+            "/calc 25 60 160 - - - - 0 - - -"
+        ),
+        "invalid_age": "Invalid age. Please enter a value between 1 and 200.",
+        "invalid_weight": "Invalid weight. Please enter a value between 1 and 1000.",
+        "invalid_height": "Invalid height. Please enter a value between 1 and 1000.",
+        "invalid_metabolism": "Invalid metabolism. Please enter a value between 1 and 10, or '-' if optional.",
+        "invalid_activity": "Invalid activity. Please enter a value between 0 and 10, or '-' if optional.",
+        "invalid_goal": "Invalid goal. Please enter -1 to lose weight, 0 to maintain, or +1 to gain weight, or '-' if optional.",
+        "invalid_desire": "Invalid desire. Please enter a value between 1 and 10 or '-' if you do not want to change your weight.",
+        "invalid_diet_type": "Invalid diet type. Please enter 0 for basic, 1 for protein, 2 for fat, or 3 for carbohydrate diet, or '-' if optional.",
+        "invalid_gender": "Invalid gender. Please enter 'm' for male, 'f' for female, or '-' if optional.",
+        "invalid_body_fat": "Invalid body fat percentage. Please enter a value between 0.1 and 100, or '-' if not applicable.",
+        "invalid_climate": "Invalid climate value. Please enter -1 for cold, 0 for humid, or +1 for hot, or '-' if optional.",
+        "invalid_rhr": "Invalid resting heart rate. Please enter a value between 40 and 140, or '-' if not applicable.",
+        "auto_update_info": "Based on your information, please use the following command to update your data:\n{command}",
+        "current_info_message": (
+            "Current data:\n"
+            "Calories: {calories} kcal\n"
+            "Protein: {protein} g\n"
+            "Fat: {fat} g\n"
+            "Carbohydrates: {carbohydrates} g\n"
+            "Water: {water} liters"
+        ),
+        "daily_progress_message": (
+            "Daily progress for {date}:\n"
+            "Eaten: {calories_eaten} out of {calories_total} kcal\n"
+            "Remaining: {calories_remaining} kcal\n\n"
+            "Protein: {protein_eaten} out of {protein_total} g (remaining: {protein_remaining} g)\n"
+            "Fat: {fat_eaten} out of {fat_total} g (remaining: {fat_remaining} g)\n"
+            "Carbohydrates: {carbs_eaten} out of {carbs_total} g (remaining: {carbs_remaining} g)\n\n"
+            "Water: {water_drank} out of {water_total} liters (remaining: {water_remaining} liters)"
+        ),
+        "daily_food_and_water_log": "Detailed log of food and water intake for {date}:",
+        "get_daily_progress_usage": "Usage: /progress [date]. Example: /progress 2023-10-15",
+        "user_count_message": "The total number of users is {count}.",
+        "invalid_grams_eaten": "Invalid grams eaten. Please enter a value between 1 and 100000 grams.",
+        "invalid_macros": "Invalid values for protein, fat, or carbohydrates. Each should be between 0 and 100000.",
+        "no_non_zero_macro": "At least one of protein, fat, or carbohydrates must be greater than zero.",
+        "stats_usage": "Usage: /stats [week/month]. Example: /stats month",
+        "no_data_for_period": "No data for this period yet.",
+        "week_stats_message": (
+            "Stats for the week starting {start}:\n"
+            "Calories: {calories} kcal ({calories_per_day} kcal per day)\n"
+            "Protein: {protein} g\n"
+            "Fat: {fat} g\n"
+            "Carbohydrates: {carbohydrates} g\n"
+            "Water: {water} liters ({water_per_day} liters per day)"
+        ),
+        "month_stats_message": (
+            "Stats for the month starting {start}:\n"
+            "Calories: {calories} kcal ({calories_per_day} kcal per day)\n"
+            "Protein: {protein} g\n"
+            "Fat: {fat} g\n"
+            "Carbohydrates: {carbohydrates} g\n"
+            "Water: {water} liters ({water_per_day} liters per day)"
+        ),
+    },
+    "ru": {
+        "start": "Привет! Я помогу тебе отслеживать калории и воду. Введи свои данные через команду /set.",
+        "data_updated": "Данные обновлены успешно!",
+        "enter_data_first": "Пожалуйста, сначала введи свои данные через команду /set.",
+        "invalid_calories": "Неверное количество калорий. Пожалуйста, введи значение от 10 до 100000.",
+        "invalid_protein_fat_carbs": "Неверное количество белков, жиров или углеводов. Каждое должно быть от 0 до 100000.",
+        "invalid_water": "Неверное количество воды. Пожалуйста, введи значение от 0.1 до 100 литров.",
+        "calories_mismatch": "Сумма калорий из белков, жиров и углеводов не совпадает с указанными калориями.",
+        "water_added": "Ты добавил {water} литров воды.",
+        "food_added": "Ты добавил еду с {calories} калориями.",
+        "invalid_timezone": "Неверный формат часового пояса. Используй формат UTC±HH или UTC±HH:MM. Примеры: UTC+03, UTC-02, UTC+05:30.",
+        "timezone_set": "Часовой пояс установлен на {timezone}.",
+        "invalid_language": "Неверный язык. Доступны только 'en' и 'ru'.",
+        "language_changed": "Язык изменен на {language}.",
+        "no_data_for_date": "Нет данных за указанную дату.",
+        "invalid_comment": "Комментарий должен быть меньше 100 символов.",
+        "error_occurred": "Произошла ошибка.",
+        "set_info_usage": "Использование: /set <калории> <белки> <жиры> <углеводы> <вода>. Пример: /set 2000 150 50 250 2.5",
+        "add_food_usage": (
+            "Использование: /food <съеденные_граммы> <белки_на_100г> <жиры_на_100г> <углеводы_на_100г> [комментарий].\n"
+            "Пример: /food 150 10 5 20 Вкусная каша."
+        ),
+        "set_timezone_usage": "Использование: /time <часовой пояс>. Примеры: /time UTC+03, /time UTC-05:30",
+        "set_language_usage": "Использование: /lang <en/ru>. Пример: /lang ru",
+        "add_water_usage": "Использование: /water <литры>. Пример: /water 2.5",
+        "get_daily_log_usage": "Использование: /log [дата]. Пример: /log 2023-10-15",
+        "invalid_date_format": "Неверный формат даты. Пожалуйста, используй формат ГГГГ-ММ-ДД.",
+        "food_entry": "[{time}] Еда: {calories} ккал, Б: {protein}, Ж: {fat}, У: {carbohydrates}, Комментарий: {comment}",
+        "water_entry": "[{time}] Вода: {water} литров",
+        "calculate_info_usage": (
+            "Использование: /calc <возраст> <вес> <рост> <метаболизм> <активность> <цель> <желание> <тип_диеты> <пол> <жирность_тела> <климат> <пульс_в_покое>.\n\n"
+            "Параметры:\n"
+            "- возраст: Целое число от 1 до 200.\n"
+            "- вес: Число с плавающей точкой от 1 до 1000 (кг).\n"
+            "- рост: Число с плавающей точкой от 1 до 1000 (см).\n"
+            "- метаболизм: Целое число от 1 до 10 или '-' (опционально).\n"
+            "- активность: Целое число от 0 до 10 или '-' (опционально).\n"
+            "- цель: Целое число -1 (похудеть), 0 (поддерживать вес), +1 (набрать вес), или '-' (опционально).\n"
+            "- желание: Целое число от 1 до 10 или '-' (насколько сильно ты хочешь похудеть/набрать вес). Если '-', не будет учитываться.\n"
+            "- тип_диеты: Целое число 0 (базовая), 1 (белковая), 2 (жирная), 3 (углеводистая), или '-' (опционально).\n"
+            "- пол: 'm' для мужского, 'f' для женского или '-' (опционально).\n"
+            "- жирность_тела: Число с плавающей точкой от 0.1 до 100 или '-' (опционально).\n"
+            "- климат: Целое число -1 (холодный), 0 (влажный), 1 (жаркий), или '-' (опционально).\n"
+            "- пульс_в_покое: Целое число от 40 до 140 или '-' (опционально).\n\n"
+            "Примеры:\n"
+            "/calc 30 70 175 5 5 -1 7 1 m 20 0 70\n"
+            "/calc 25 60 160 - - - - 0 - - -"
+        ),
+        "invalid_age": "Неверный возраст. Пожалуйста, введи значение от 1 до 200.",
+        "invalid_weight": "Неверный вес. Пожалуйста, введи значение от 1 до 1000.",
+        "invalid_height": "Неверный рост. Пожалуйста, введи значение от 1 до 1000.",
+        "invalid_metabolism": "Неверный метаболизм. Пожалуйста, введи значение от 1 до 10, или '-' если опционально.",
+        "invalid_activity": "Неверная активность. Пожалуйста, введи значение от 0 до 10, или '-' если опционально.",
+        "invalid_goal": "Неверная цель. Пожалуйста, введи -1 для похудения, 0 для поддержания или +1 для набора веса, или '-' если опционально.",
+        "invalid_desire": "Неверное желание. Пожалуйста, введи значение от 1 до 10 или '-' если ты не хочешь менять вес.",
+        "invalid_diet_type": "Неверный тип диеты. Пожалуйста, введи 0 для базовой, 1 для белковой, 2 для жирной или 3 для углеводистой диеты, или '-' если опционально.",
+        "invalid_gender": "Неверный пол. Пожалуйста, введи 'm' для мужского, 'f' для женского или '-' если опционально.",
+        "invalid_body_fat": "Неверный процент жира в теле. Введи значение от 0.1 до 100 или '-' если не применяется.",
+        "invalid_climate": "Неверное значение климата. Пожалуйста, введи -1 для холодного, 0 для влажного или +1 для жаркого, или '-' если опционально.",
+        "invalid_rhr": "Неверный пульс в покое. Введи значение от 40 до 140, или '-' если не применяется.",
+        "auto_update_info": "Исходя из твоих данных, пожалуйста, используй следующую команду для обновления информации:\n{command}",
+        "current_info_message": (
+            "Текущие данные:\n"
+            "Калории: {calories} ккал\n"
+            "Белки: {protein} г\n"
+            "Жиры: {fat} г\n"
+            "Углеводы: {carbohydrates} г\n"
+            "Вода: {water} литров"
+        ),
+        "daily_progress_message": (
+            "Дневной прогресс на {date}:\n"
+            "Съедено: {calories_eaten} из {calories_total} ккал\n"
+            "Осталось: {calories_remaining} ккал\n\n"
+            "Белки: {protein_eaten} из {protein_total} г (осталось: {protein_remaining} г)\n"
+            "Жиры: {fat_eaten} из {fat_total} г (осталось: {fat_remaining} г)\n"
+            "Углеводы: {carbs_eaten} из {carbs_total} г (осталось: {carbs_remaining} г)\n\n"
+            "Вода: выпито {water_drank} из {water_total} литров (осталось: {water_remaining} литров)"
+        ),
+        "daily_food_and_water_log": "Подробный отчет о потреблении пищи и воды за {date}:",
+        "get_daily_progress_usage": "Использование: /progress [дата]. Пример: /progress 2023-10-15",
+        "user_count_message": "Общее количество пользователей: {count}.",
+        "invalid_grams_eaten": "Неверное количество грамм. Пожалуйста, введи значение от 1 до 100000 грамм.",
+        "invalid_macros": "Неверные значения для белков, жиров или углеводов. Каждое должно быть от 0 до 100000.",
+        "no_non_zero_macro": "Хотя бы одно из значений белков, жиров или углеводов должно быть больше нуля.",
+        "stats_usage": "Использование: /stats [week/month]. Пример: /stats month",
+        "no_data_for_period": "За этот период пока нет данных.",
+        "week_stats_message": (
+            "Статистика за неделю с {start}:\n"
+            "Калории: {calories} ккал ({calories_per_day} ккал в день)\n"
+            "Белки: {protein} г\n"
+            "Жиры: {fat} г\n"
+            "Углеводы: {carbohydrates} г\n"
+            "Вода: {water} литров ({water_per_day} литров в день)"
+        ),
+        "month_stats_message": (
+            "Статистика за месяц с {start}:\n"
+            "Калории: {calories} ккал ({calories_per_day} ккал в день)\n"
+            "Белки: {protein} г\n"
+            "Жиры: {fat} г\n"
+            "Углеводы: {carbohydrates} г\n"
+            "Вода: {water} литров ({water_per_day} литров в день)"
+        ),
+    },
+}
+
+DEFAULT_LANGUAGE = "en"
+
+
+def get_placeholders(template: str):
+    return {field for _, field, _, _ in string.Formatter().parse(template) if field}
+
+
+class Translator:
+    def __init__(self, language: str, messages: dict, fallback: dict):
+        unknown_keys = messages.keys() - fallback.keys()
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown translation keys for '{language}': {sorted(unknown_keys)}"
+            )
+
+        missing_keys = fallback.keys() - messages.keys()
+        if missing_keys:
+            logger.warning(
+                f"Missing translations for '{language}', falling back to "
+                f"'{DEFAULT_LANGUAGE}': {sorted(missing_keys)}"
+            )
+
+        self.language = language
+        self.formatters = {}
+        for key, fallback_template in fallback.items():
+            template = messages.get(key, fallback_template)
+            if get_placeholders(template) != get_placeholders(fallback_template):
+                raise ValueError(
+                    f"Placeholders of '{key}' for '{language}' do not match "
+                    f"'{DEFAULT_LANGUAGE}'."
+                )
+            self.formatters[key] = template.format
+
+    def format(self, key: str, **kwargs):
+        for k, v in kwargs.items():
+            if isinstance(v, float):
+                kwargs[k] = round(v, 1)
+        return self.formatters[key](**kwargs)
+
+    def format_many(self, entries):
+        formatters = self.formatters
+        messages = []
+        for key, kwargs in entries:
+            for k, v in kwargs.items():
+                if isinstance(v, float):
+                    kwargs[k] = round(v, 1)
+            messages.append(formatters[key](**kwargs))
+        return messages
+
+
+translators = {
+    language: Translator(language, messages, translations[DEFAULT_LANGUAGE])
+    for language, messages in translations.items()
+}
+
+
+def get_translator(user_language):
+    return translators.get(user_language, translators[DEFAULT_LANGUAGE])
+
+
+def get_translation(user_language, key, **kwargs):
+    return get_translator(user_language).format(key, **kwargs)
+
+
+def round_value(value):
+    if isinstance(value, float):
+        return round(value, 1)
+    return value
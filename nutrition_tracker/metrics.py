@@ -0,0 +1,139 @@
+import time
+from contextvars import ContextVar
+from aiogram import types
+from aiogram.dispatcher.middlewares import BaseMiddleware
+from prometheus_client import REGISTRY, Counter, Histogram, start_http_server
+from prometheus_client.core import CounterMetricFamily
+from sqlalchemy import event
+from .cache import calc_memo
+
+COMMANDS = {
+    "start",
+    "set",
+    "food",
+    "water",
+    "log",
+    "calc",
+    "get",
+    "count",
+    "progress",
+    "reset",
+    "stats",
+    "time",
+    "lang",
+}
+
+update_stats = ContextVar("update_stats", default=None)
+
+handler_latency = Histogram(
+    "bot_handler_latency_seconds",
+    "Time spent handling a message, by command.",
+    ["command"],
+)
+handler_errors = Counter(
+    "bot_handler_errors_total",
+    "Messages that ended with an error reply or an unhandled exception, by command.",
+    ["command"],
+)
+db_queries = Histogram(
+    "bot_db_queries_per_update",
+    "Database statements executed while handling a message, by command.",
+    ["command"],
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20),
+)
+db_time = Histogram(
+    "bot_db_time_seconds",
+    "Time spent in database statements while handling a message, by command.",
+    ["command"],
+)
+user_lookups = Counter(
+    "bot_user_lookups_total",
+    "Sender lookups made while handling a message, by where the user was found.",
+    ["source"],
+)
+
+
+class CalcMemoCollector:
+    def collect(self):
+        lookups = CounterMetricFamily(
+            "bot_calc_memo_lookups",
+            "/calc memo lookups, by where the reply was found.",
+            labels=["result"],
+        )
+        lookups.add_metric(["memory"], calc_memo.hits)
+        lookups.add_metric(["redis"], calc_memo.redis_hits)
+        lookups.add_metric(["miss"], calc_memo.misses)
+        yield lookups
+
+
+def get_command_label(message: types.Message):
+    command = (message.get_command(pure=True) or "").lower()
+    return command if command in COMMANDS else "other"
+
+
+def mark_error():
+    stats = update_stats.get()
+    if stats is not None:
+        stats["error"] = True
+
+
+def count_user_lookup(source: str):
+    user_lookups.labels(source).inc()
+
+
+class MetricsMiddleware(BaseMiddleware):
+    async def on_pre_process_message(self, message: types.Message, data: dict):
+        update_stats.set(
+            {
+                "started": time.perf_counter(),
+                "queries": 0,
+                "db_time": 0.0,
+                "error": False,
+            }
+        )
+
+    async def on_post_process_message(
+        self, message: types.Message, results, data: dict
+    ):
+        stats = update_stats.get()
+        if stats is None:
+            return
+        command = get_command_label(message)
+        handler_latency.labels(command).observe(time.perf_counter() - stats["started"])
+        db_queries.labels(command).observe(stats["queries"])
+        db_time.labels(command).observe(stats["db_time"])
+        if stats["error"]:
+            handler_errors.labels(command).inc()
+
+    async def on_pre_process_error(self, update: types.Update, error, data: dict):
+        if update.message:
+            handler_errors.labels(get_command_label(update.message)).inc()
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = update_stats.get()
+    if stats is not None:
+        stats["queries"] += 1
+        stats["db_time"] += time.perf_counter() - started
+
+
+def handle_db_error(context):
+    if context.connection is not None and context.connection.info.get("query_started"):
+        context.connection.info["query_started"].pop()
+
+
+def setup(dispatcher, engine):
+    dispatcher.middleware.setup(MetricsMiddleware())
+    REGISTRY.register(CalcMemoCollector())
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", handle_db_error)
+
+
+def start_server(port: int, host: str = "127.0.0.1"):
+    start_http_server(port, addr=host)
@@ -0,0 +1,149 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    Float,
+    String,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import func
+
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True)
+    telegram_id = Column(Integer, unique=True, nullable=False)
+    timezone = Column(String, default="UTC", nullable=False)
+    language = Column(String, default="en", nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class InfoLog(Base):
+    __tablename__ = "info_log"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    calories = Column(Float, default=0.0, nullable=False)
+    protein = Column(Float, default=0.0, nullable=False)
+    fat = Column(Float, default=0.0, nullable=False)
+    carbohydrates = Column(Float, default=0.0, nullable=False)
+    water = Column(Float, default=0.0, nullable=False)
+    date = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_info_log_user_id_date", "user_id", "date"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
+
+
+class FoodLog(Base):
+    __tablename__ = "food_log"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    date = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        nullable=False,
+    )
+    calories = Column(Float, default=0.0, nullable=False)
+    protein = Column(Float, default=0.0, nullable=False)
+    fat = Column(Float, default=0.0, nullable=False)
+    carbohydrates = Column(Float, default=0.0, nullable=False)
+    comment = Column(String, default="", nullable=False)
+
+    __table_args__ = (
+        Index("ix_food_log_user_id_date", "user_id", "date"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
+
+
+class WaterLog(Base):
+    __tablename__ = "water_log"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    date = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        nullable=False,
+    )
+    water = Column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (
+        Index("ix_water_log_user_id_date", "user_id", "date"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
+
+
+class DailySummary(Base):
+    __tablename__ = "daily_summary"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    day = Column(Date, nullable=False)
+    total_calories = Column(Float, default=0.0, nullable=False)
+    total_protein = Column(Float, default=0.0, nullable=False)
+    total_fat = Column(Float, default=0.0, nullable=False)
+    total_carbohydrates = Column(Float, default=0.0, nullable=False)
+    total_water = Column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_daily_summary_user_id_day"),
+    )
+
+
+class WeeklySummary(Base):
+    __tablename__ = "weekly_summary"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    week_start = Column(Date, nullable=False)
+    total_calories = Column(Float, default=0.0, nullable=False)
+    total_protein = Column(Float, default=0.0, nullable=False)
+    total_fat = Column(Float, default=0.0, nullable=False)
+    total_carbohydrates = Column(Float, default=0.0, nullable=False)
+    total_water = Column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "week_start", name="uq_weekly_summary_user_id_week_start"
+        ),
+    )
+
+
+class MonthlySummary(Base):
+    __tablename__ = "monthly_summary"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    month_start = Column(Date, nullable=False)
+    total_calories = Column(Float, default=0.0, nullable=False)
+    total_protein = Column(Float, default=0.0, nullable=False)
+    total_fat = Column(Float, default=0.0, nullable=False)
+    total_carbohydrates = Column(Float, default=0.0, nullable=False)
+    total_water = Column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "month_start", name="uq_monthly_summary_user_id_month_start"
+        ),
+    )
+
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    applied_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,245 @@
+from collections import namedtuple
+
+NutritionNeeds = namedtuple(
+    "NutritionNeeds", ["tdee", "protein", "fat", "carbohydrates", "water"]
+)
+
+CalcParams = namedtuple(
+    "CalcParams",
+    [
+        "age",
+        "weight",
+        "height",
+        "metabolism",
+        "activity",
+        "goal",
+        "desire",
+        "diet_type",
+        "gender",
+        "body_fat",
+        "climate",
+        "resting_heart_rate",
+    ],
+)
+
+DIET_MACRO_PERCENTS = {
+    0: (20, 30, 50),
+    1: (45, 30, 25),
+    2: (15, 75, 10),
+    3: (15, 25, 60),
+}
+
+
+def parse_value(value, parse, is_valid, default=None, optional=True):
+    if optional and value == "-":
+        return default
+    parsed = parse(value)
+    if not is_valid(parsed):
+        raise ValueError(f"Value out of range: {value}")
+    return parsed
+
+
+def parse_calc_params(data):
+    if len(data) != 12:
+        return None, "calculate_info_usage"
+
+    fields = [
+        ("invalid_age", data[0], int, lambda v: 1 <= v <= 200, None, False),
+        ("invalid_weight", data[1], float, lambda v: 1 <= v <= 1000, None, False),
+        ("invalid_height", data[2], float, lambda v: 1 <= v <= 300, None, False),
+        ("invalid_metabolism", data[3], int, lambda v: 1 <= v <= 10, None, True),
+        ("invalid_activity", data[4], int, lambda v: 0 <= v <= 10, 0, True),
+        ("invalid_goal", data[5], int, lambda v: v in [-1, 0, 1], 0, True),
+        ("invalid_desire", data[6].lower(), int, lambda v: 1 <= v <= 10, None, True),
+        ("invalid_diet_type", data[7], int, lambda v: v in [0, 1, 2, 3], 0, True),
+        ("invalid_gender", data[8].lower(), str, lambda v: v in ["m", "f"], None, True),
+        (
+            "invalid_body_fat",
+            data[9].lower(),
+            float,
+            lambda v: 0.1 <= v <= 100,
+            None,
+            True,
+        ),
+        ("invalid_climate", data[10], int, lambda v: v in [-1, 0, 1], 0, True),
+        ("invalid_rhr", data[11].lower(), int, lambda v: 40 <= v <= 140, None, True),
+    ]
+
+    values = []
+    for error_key, value, parse, is_valid, default, optional in fields:
+        try:
+            values.append(parse_value(value, parse, is_valid, default, optional))
+        except ValueError:
+            return None, error_key
+    return CalcParams(*values), None
+
+
+def calculate_needs(
+    age,
+    weight,
+    height,
+    metabolism=None,
+    activity=0,
+    goal=0,
+    desire=None,
+    diet_type=0,
+    gender=None,
+    body_fat=None,
+    climate=0,
+    resting_heart_rate=None,
+):
+    metabolism_adjustment = 0.95 if age > 60 else 1.0
+
+    menopause_adjustment = 0.9 if gender == "f" and age >= 50 else 1.0
+
+    heart_rate_adjustment = 70 / resting_heart_rate if resting_heart_rate else 1.0
+
+    if gender is None:
+        bmr_mifflin_m = 10 * weight + 6.25 * height - 5 * age + 5
+        bmr_mifflin_f = 10 * weight + 6.25 * height - 5 * age - 161
+        bmr_mifflin = (bmr_mifflin_m + bmr_mifflin_f) / 2
+
+        bmr_harris_m = 66.5 + (13.75 * weight) + (5.003 * height) - (6.775 * age)
+        bmr_harris_f = 655.1 + (9.563 * weight) + (1.85 * height) - (4.676 * age)
+        bmr_harris = (bmr_harris_m + bmr_harris_f) / 2
+    elif gender == "m":
+        bmr_mifflin = 10 * weight + 6.25 * height - 5 * age + 5
+        bmr_harris = 66.5 + (13.75 * weight) + (5.003 * height) - (6.775 * age)
+    else:
+        bmr_mifflin = 10 * weight + 6.25 * height - 5 * age - 161
+        bmr_harris = 655.1 + (9.563 * weight) + (1.85 * height) - (4.676 * age)
+
+    bmr = (bmr_mifflin + bmr_harris) / 2
+
+    if metabolism is not None:
+        metabolism_coefficient = 0.95 + (metabolism - 1) * 0.01
+        metabolism_coefficient = min(max(metabolism_coefficient, 0.95), 1.05)
+        bmr *= metabolism_coefficient
+
+    bmr *= metabolism_adjustment * menopause_adjustment * heart_rate_adjustment
+
+    activity_factor = 1.2 + 0.1 * activity if activity <= 9 else 1.9
+    tdee = bmr * activity_factor
+
+    if goal == -1 and desire is not None:
+        tdee -= 500 * (desire / 10)
+    elif goal == 1 and desire is not None:
+        tdee += 500 * (desire / 10)
+
+    protein_percent, fat_percent, carbs_percent = DIET_MACRO_PERCENTS[diet_type]
+
+    protein_cal = tdee * (protein_percent / 100)
+    fat_cal = tdee * (fat_percent / 100)
+
+    protein_grams = round(protein_cal / 4)
+    fat_grams = round(fat_cal / 9)
+    carbs_grams = round((tdee - (protein_grams * 4 + fat_grams * 9)) / 4)
+
+    climate_multiplier = 0.8 if climate == -1 else 1.2 if climate == 1 else 1.0
+    water_multiplier = (
+        1.0 + (activity * 0.05) if activity <= 3 else 1.25 + ((activity - 6) * 0.15)
+    )
+    water = min(100, round(weight * 0.035 * climate_multiplier * water_multiplier, 1))
+
+    return NutritionNeeds(tdee, protein_grams, fat_grams, carbs_grams, water)
+
+
+def calculate_needs_batch(
+    age,
+    weight,
+    height,
+    metabolism,
+    activity,
+    goal,
+    desire,
+    diet_type,
+    gender,
+    body_fat,
+    climate,
+    resting_heart_rate,
+):
+    import numpy as np
+
+    age = np.asarray(age, dtype=float)
+    weight = np.asarray(weight, dtype=float)
+    height = np.asarray(height, dtype=float)
+    metabolism = np.asarray(metabolism, dtype=float)
+    activity = np.asarray(activity, dtype=float)
+    goal = np.asarray(goal, dtype=float)
+    desire = np.asarray(desire, dtype=float)
+    diet_type = np.asarray(diet_type, dtype=int)
+    gender = np.asarray(gender, dtype=object)
+    climate = np.asarray(climate, dtype=float)
+    resting_heart_rate = np.asarray(resting_heart_rate, dtype=float)
+
+    is_male = gender == "m"
+    is_female = gender == "f"
+    has_metabolism = ~np.isnan(metabolism)
+    has_desire = ~np.isnan(desire)
+    has_heart_rate = ~np.isnan(resting_heart_rate)
+
+    metabolism_adjustment = np.where(age > 60, 0.95, 1.0)
+
+    menopause_adjustment = np.where(is_female & (age >= 50), 0.9, 1.0)
+
+    heart_rate_adjustment = np.ones_like(resting_heart_rate)
+    np.divide(70, resting_heart_rate, out=heart_rate_adjustment, where=has_heart_rate)
+
+    bmr_mifflin_m = 10 * weight + 6.25 * height - 5 * age + 5
+    bmr_mifflin_f = 10 * weight + 6.25 * height - 5 * age - 161
+    bmr_mifflin = np.where(
+        is_male,
+        bmr_mifflin_m,
+        np.where(is_female, bmr_mifflin_f, (bmr_mifflin_m + bmr_mifflin_f) / 2),
+    )
+
+    bmr_harris_m = 66.5 + (13.75 * weight) + (5.003 * height) - (6.775 * age)
+    bmr_harris_f = 655.1 + (9.563 * weight) + (1.85 * height) - (4.676 * age)
+    bmr_harris = np.where(
+        is_male,
+        bmr_harris_m,
+        np.where(is_female, bmr_harris_f, (bmr_harris_m + bmr_harris_f) / 2),
+    )
+
+    bmr = (bmr_mifflin + bmr_harris) / 2
+
+    metabolism_coefficient = np.clip(0.95 + (metabolism - 1) * 0.01, 0.95, 1.05)
+    bmr = np.where(has_metabolism, bmr * metabolism_coefficient, bmr)
+
+    bmr = bmr * (metabolism_adjustment * menopause_adjustment * heart_rate_adjustment)
+
+    activity_factor = np.where(activity <= 9, 1.2 + 0.1 * activity, 1.9)
+    tdee = bmr * activity_factor
+
+    desire_adjustment = 500 * (desire / 10)
+    tdee = np.where((goal == -1) & has_desire, tdee - desire_adjustment, tdee)
+    tdee = np.where((goal == 1) & has_desire, tdee + desire_adjustment, tdee)
+
+    macro_percents = np.array(
+        [DIET_MACRO_PERCENTS[key] for key in sorted(DIET_MACRO_PERCENTS)],
+        dtype=float,
+    )[diet_type]
+
+    protein_cal = tdee * (macro_percents[:, 0] / 100)
+    fat_cal = tdee * (macro_percents[:, 1] / 100)
+
+    protein_grams = np.rint(protein_cal / 4)
+    fat_grams = np.rint(fat_cal / 9)
+    carbs_grams = np.rint((tdee - (protein_grams * 4 + fat_grams * 9)) / 4)
+
+    climate_multiplier = np.where(climate == -1, 0.8, np.where(climate == 1, 1.2, 1.0))
+    water_multiplier = np.where(
+        activity <= 3, 1.0 + (activity * 0.05), 1.25 + ((activity - 6) * 0.15)
+    )
+    raw_water = weight * 0.035 * climate_multiplier * water_multiplier
+
+    # np.round works on the binary value times ten, while round() rounds the
+    # exact decimal value, so the two only disagree next to a .x5 tie.
+    water = np.round(raw_water, 1)
+    scaled_water = raw_water * 10
+    near_tie = np.abs(scaled_water - np.floor(scaled_water) - 0.5) < 1e-6
+    if near_tie.any():
+        water[near_tie] = [round(value, 1) for value in raw_water[near_tie].tolist()]
+    water = np.minimum(100, water)
+
+    return NutritionNeeds(tdee, protein_grams, fat_grams, carbs_grams, water)
@@ -0,0 +1,39 @@
+from datetime import date
+
+PARTITIONED_TABLES = ("info_log", "food_log", "water_log")
+
+
+def add_months(month_start: date, months: int):
+    month_index = month_start.month - 1 + months
+    return date(month_start.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def format_bound(month_start: date):
+    return f"{month_start.isoformat()} 00:00+00"
+
+
+def get_partition_name(table_name: str, month_start: date):
+    return f"{table_name}_{month_start:%Y_%m}"
+
+
+def build_partition_ddl(table_name: str, month_start: date):
+    partition_name = get_partition_name(table_name, month_start)
+    return f"""
+        DO $$
+        BEGIN
+            CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF {table_name}
+                FOR VALUES FROM ('{format_bound(month_start)}')
+                TO ('{format_bound(add_months(month_start, 1))}');
+        EXCEPTION WHEN invalid_object_definition OR wrong_object_type THEN
+            NULL;
+        END $$
+    """
+
+
+def build_upcoming_partitions_ddl(today: date, months_ahead: int):
+    month_start = today.replace(day=1)
+    return [
+        build_partition_ddl(table_name, add_months(month_start, offset))
+        for table_name in PARTITIONED_TABLES
+        for offset in range(months_ahead + 1)
+    ]
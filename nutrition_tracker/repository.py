@@ -0,0 +1,318 @@
+from datetime import timedelta
+from sqlalchemy import (
+    Float,
+    bindparam,
+    String,
+    cast,
+    delete,
+    insert,
+    literal,
+    null,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+from .cache import (
+    CachedUser,
+    cache_user,
+    invalidate_cached_user,
+    user_counter,
+)
+from .models import (
+    DailySummary,
+    FoodLog,
+    InfoLog,
+    MonthlySummary,
+    User,
+    WaterLog,
+    WeeklySummary,
+)
+
+TOTAL_FIELDS = (
+    "total_calories",
+    "total_protein",
+    "total_fat",
+    "total_carbohydrates",
+    "total_water",
+)
+
+
+def get_week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def get_month_start(day):
+    return day.replace(day=1)
+
+
+ROLLUPS = {
+    "week": (WeeklySummary, WeeklySummary.week_start, get_week_start),
+    "month": (MonthlySummary, MonthlySummary.month_start, get_month_start),
+}
+
+
+async def load_or_create_user(session, telegram_id: int):
+    stmt = select(User.id, User.timezone, User.language).where(
+        User.telegram_id == telegram_id
+    )
+    result = await session.execute(stmt)
+    row = result.first()
+    if row:
+        user = CachedUser(id=row.id, timezone=row.timezone, language=row.language)
+    else:
+        new_user = User(telegram_id=telegram_id)
+        session.add(new_user)
+        await session.commit()
+        await session.refresh(new_user)
+        await user_counter.increment()
+        user = CachedUser(
+            id=new_user.id, timezone=new_user.timezone, language=new_user.language
+        )
+
+    await cache_user(telegram_id, user)
+    return user
+
+
+async def update_user_settings(session, telegram_id: int, user_id: int, **values):
+    await session.execute(update(User).where(User.id == user_id).values(**values))
+    await session.commit()
+    await invalidate_cached_user(telegram_id)
+
+
+def build_summary_increment(
+    user_id: int,
+    day,
+    current_time,
+    calories=0.0,
+    protein=0.0,
+    fat=0.0,
+    carbohydrates=0.0,
+    water=0.0,
+):
+    return build_summary_upsert(
+        {
+            "user_id": user_id,
+            "date": current_time,
+            "day": day,
+            "total_calories": calories,
+            "total_protein": protein,
+            "total_fat": fat,
+            "total_carbohydrates": carbohydrates,
+            "total_water": water,
+        }
+    )
+
+
+def build_summary_upsert(values):
+    summaries = values if isinstance(values, list) else [values]
+    stmt = pg_insert(DailySummary).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[DailySummary.user_id, DailySummary.day],
+        set_={
+            "total_calories": DailySummary.total_calories
+            + stmt.excluded.total_calories,
+            "total_protein": DailySummary.total_protein + stmt.excluded.total_protein,
+            "total_fat": DailySummary.total_fat + stmt.excluded.total_fat,
+            "total_carbohydrates": DailySummary.total_carbohydrates
+            + stmt.excluded.total_carbohydrates,
+            "total_water": DailySummary.total_water + stmt.excluded.total_water,
+        },
+    ).add_cte(*build_rollup_upserts(summaries))
+
+
+def build_rollup_upserts(summaries):
+    upserts = []
+    for model, start_column, get_start in ROLLUPS.values():
+        rollups = {}
+        for summary in summaries:
+            key = (summary["user_id"], get_start(summary["day"]))
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = {"user_id": key[0], start_column.key: key[1]}
+                rollup.update(dict.fromkeys(TOTAL_FIELDS, 0.0))
+                rollups[key] = rollup
+            for field in TOTAL_FIELDS:
+                rollup[field] += summary[field]
+
+        table_name = model.__tablename__
+        stmt = pg_insert(model).values(
+            [
+                {
+                    column: bindparam(
+                        f"{table_name}_{column}_{index}",
+                        value,
+                        type_=model.__table__.c[column].type,
+                    )
+                    for column, value in rollup.items()
+                }
+                for index, rollup in enumerate(rollups.values())
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.user_id, start_column],
+            set_={
+                field: getattr(model, field) + getattr(stmt.excluded, field)
+                for field in TOTAL_FIELDS
+            },
+        )
+        upserts.append(stmt.cte(f"{table_name}_upsert"))
+    return upserts
+
+
+def build_summary_reset(user_id: int, day, current_time, old_totals=None):
+    stmt = pg_insert(DailySummary).values(
+        user_id=user_id,
+        date=current_time,
+        day=day,
+        total_calories=0.0,
+        total_protein=0.0,
+        total_fat=0.0,
+        total_carbohydrates=0.0,
+        total_water=0.0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailySummary.user_id, DailySummary.day],
+        set_={
+            "total_calories": 0.0,
+            "total_protein": 0.0,
+            "total_fat": 0.0,
+            "total_carbohydrates": 0.0,
+            "total_water": 0.0,
+        },
+    )
+    if old_totals:
+        stmt = stmt.add_cte(*build_rollup_subtractions(user_id, day, old_totals))
+    return stmt
+
+
+def build_rollup_subtractions(user_id: int, day, old_totals):
+    return [
+        update(model)
+        .where(model.user_id == user_id, start_column == get_start(day))
+        .values(
+            {field: getattr(model, field) - old_totals[field] for field in TOTAL_FIELDS}
+        )
+        .cte(f"{model.__tablename__}_reset")
+        for model, start_column, get_start in ROLLUPS.values()
+    ]
+
+
+async def add_info_log(session, row: dict):
+    session.add(InfoLog(**row))
+    await session.commit()
+
+
+async def add_food_log(session, row: dict, day):
+    food_insert = insert(FoodLog).values(row).cte("food_insert")
+    stmt = build_summary_increment(
+        row["user_id"],
+        day,
+        row["date"],
+        calories=row["calories"],
+        protein=row["protein"],
+        fat=row["fat"],
+        carbohydrates=row["carbohydrates"],
+    ).add_cte(food_insert)
+    await session.execute(stmt)
+    await session.commit()
+
+
+async def add_water_log(session, row: dict, day):
+    water_insert = insert(WaterLog).values(row).cte("water_insert")
+    stmt = build_summary_increment(
+        row["user_id"], day, row["date"], water=row["water"]
+    ).add_cte(water_insert)
+    await session.execute(stmt)
+    await session.commit()
+
+
+async def stream_log_entries(session, user_id: int, start_datetime, end_datetime):
+    food_stmt = select(
+        literal("food", String).label("type"),
+        FoodLog.date,
+        FoodLog.calories,
+        FoodLog.protein,
+        FoodLog.fat,
+        FoodLog.carbohydrates,
+        FoodLog.comment,
+        cast(null(), Float).label("water"),
+    ).where(
+        FoodLog.user_id == user_id,
+        FoodLog.date >= start_datetime,
+        FoodLog.date <= end_datetime,
+    )
+
+    water_stmt = select(
+        literal("water", String).label("type"),
+        WaterLog.date,
+        cast(null(), Float).label("calories"),
+        cast(null(), Float).label("protein"),
+        cast(null(), Float).label("fat"),
+        cast(null(), Float).label("carbohydrates"),
+        cast(null(), String).label("comment"),
+        WaterLog.water,
+    ).where(
+        WaterLog.user_id == user_id,
+        WaterLog.date >= start_datetime,
+        WaterLog.date <= end_datetime,
+    )
+
+    return await session.stream(union_all(food_stmt, water_stmt).order_by("date"))
+
+
+async def get_latest_info_log(
+    session, user_id: int, start_datetime=None, end_datetime=None
+):
+    stmt = select(InfoLog).where(InfoLog.user_id == user_id)
+    if start_datetime is not None:
+        stmt = stmt.where(InfoLog.date >= start_datetime, InfoLog.date <= end_datetime)
+    result = await session.execute(stmt.order_by(InfoLog.date.desc()).limit(1))
+    return result.scalars().first()
+
+
+async def get_daily_summary(session, user_id: int, day):
+    stmt = select(DailySummary).where(
+        DailySummary.user_id == user_id,
+        DailySummary.day == day,
+    )
+    result = await session.execute(stmt)
+    return result.scalars().first()
+
+
+async def get_rollup(session, period: str, user_id: int, day):
+    model, start_column, get_start = ROLLUPS[period]
+    stmt = select(model).where(
+        model.user_id == user_id,
+        start_column == get_start(day),
+    )
+    result = await session.execute(stmt)
+    return result.scalars().first()
+
+
+async def delete_day(
+    session, user_id: int, day, current_time, start_datetime, end_datetime
+):
+    deleted_logs = [
+        delete(model)
+        .where(
+            model.user_id == user_id,
+            model.date >= start_datetime,
+            model.date <= end_datetime,
+        )
+        .returning(model.id)
+        .cte(f"deleted_{model.__tablename__}")
+        for model in (FoodLog, WaterLog, InfoLog)
+    ]
+    result = await session.execute(
+        select(*(getattr(DailySummary, field) for field in TOTAL_FIELDS))
+        .where(DailySummary.user_id == user_id, DailySummary.day == day)
+        .with_for_update()
+    )
+    old_totals = result.mappings().first()
+    await session.execute(
+        build_summary_reset(user_id, day, current_time, old_totals).add_cte(
+            *deleted_logs
+        )
+    )
+    await session.commit()
@@ -0,0 +1 @@
+SCHEMA_VERSION = 4
@@ -0,0 +1,314 @@
+from datetime import datetime
+from .cache import (
+    cache_progress,
+    get_cached_progress,
+    get_progress_version,
+    invalidate_cached_progress,
+    update_cached_progress,
+    user_counter,
+)
+from .i18n import translations
+from .repository import (
+    ROLLUPS,
+    add_food_log,
+    add_info_log,
+    add_water_log,
+    delete_day,
+    get_daily_summary,
+    get_latest_info_log,
+    get_rollup,
+    stream_log_entries,
+    update_user_settings,
+)
+from .timezones import (
+    TIMEZONE_INPUT_PATTERN,
+    get_day_bounds,
+    get_local_date,
+    get_utc_now,
+)
+from .write_behind import write_behind
+
+LOG_BATCH_SIZE = 100
+
+
+class ValidationError(ValueError):
+    def __init__(self, key: str):
+        super().__init__(key)
+        self.key = key
+
+
+def parse_float(value, error_key: str):
+    try:
+        return float(value)
+    except ValueError:
+        raise ValidationError(error_key)
+
+
+def get_target_date(user, date_str=None):
+    if date_str is None:
+        return get_local_date(get_utc_now(), user.timezone)
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValidationError("invalid_date_format")
+
+
+async def set_targets(session, user, calories, protein, fat, carbohydrates, water):
+    calories = parse_float(calories, "invalid_calories")
+    protein = parse_float(protein, "invalid_protein_fat_carbs")
+    fat = parse_float(fat, "invalid_protein_fat_carbs")
+    carbohydrates = parse_float(carbohydrates, "invalid_protein_fat_carbs")
+    water = parse_float(water, "invalid_water")
+
+    total_calories = (protein * 4) + (fat * 9) + (carbohydrates * 4)
+    if abs(total_calories - calories) > 10:
+        raise ValidationError("calories_mismatch")
+
+    if not (10 <= calories <= 100000):
+        raise ValidationError("invalid_calories")
+    if not (
+        0 <= protein <= 100000 and 0 <= fat <= 100000 and 0 <= carbohydrates <= 100000
+    ):
+        raise ValidationError("invalid_protein_fat_carbs")
+    if not (0.1 <= water <= 100):
+        raise ValidationError("invalid_water")
+
+    current_time = get_utc_now()
+    target_date = get_local_date(current_time, user.timezone)
+
+    await add_info_log(
+        session,
+        {
+            "user_id": user.id,
+            "calories": calories,
+            "protein": protein,
+            "fat": fat,
+            "carbohydrates": carbohydrates,
+            "water": water,
+            "date": current_time,
+        },
+    )
+    await update_cached_progress(
+        user.id,
+        target_date,
+        "HSET",
+        calories_total=calories,
+        protein_total=protein,
+        fat_total=fat,
+        carbs_total=carbohydrates,
+        water_total=water,
+    )
+
+
+async def log_food(
+    session,
+    user,
+    grams_eaten,
+    protein_per_100g,
+    fat_per_100g,
+    carbs_per_100g,
+    comment: str = "",
+):
+    grams_eaten = parse_float(grams_eaten, "invalid_grams_eaten")
+    if not (1 <= grams_eaten <= 100000):
+        raise ValidationError("invalid_grams_eaten")
+
+    protein_per_100g = parse_float(protein_per_100g, "invalid_macros")
+    fat_per_100g = parse_float(fat_per_100g, "invalid_macros")
+    carbs_per_100g = parse_float(carbs_per_100g, "invalid_macros")
+    if not (
+        0 <= protein_per_100g <= 100000
+        and 0 <= fat_per_100g <= 100000
+        and 0 <= carbs_per_100g <= 100000
+    ):
+        raise ValidationError("invalid_macros")
+    if not (protein_per_100g > 0 or fat_per_100g > 0 or carbs_per_100g > 0):
+        raise ValidationError("no_non_zero_macro")
+
+    protein = (protein_per_100g * grams_eaten) / 100
+    fat = (fat_per_100g * grams_eaten) / 100
+    carbs = (carbs_per_100g * grams_eaten) / 100
+    calories = (protein * 4) + (fat * 9) + (carbs * 4)
+
+    if len(comment) > 100:
+        raise ValidationError("invalid_comment")
+
+    current_time = get_utc_now()
+    target_date = get_local_date(current_time, user.timezone)
+
+    food_row = {
+        "user_id": user.id,
+        "calories": calories,
+        "protein": protein,
+        "fat": fat,
+        "carbohydrates": carbs,
+        "comment": comment,
+        "date": current_time,
+    }
+    if write_behind:
+        write_behind.add_food(food_row, target_date)
+    else:
+        await add_food_log(session, food_row, target_date)
+    await update_cached_progress(
+        user.id,
+        target_date,
+        "HINCRBYFLOAT",
+        calories_eaten=calories,
+        protein_eaten=protein,
+        fat_eaten=fat,
+        carbs_eaten=carbs,
+    )
+    return food_row
+
+
+async def log_water(session, user, water):
+    water = parse_float(water, "invalid_water")
+    if not (0.1 <= water <= 100):
+        raise ValidationError("invalid_water")
+
+    current_time = get_utc_now()
+    target_date = get_local_date(current_time, user.timezone)
+
+    water_row = {"user_id": user.id, "water": water, "date": current_time}
+    if write_behind:
+        write_behind.add_water(water_row, target_date)
+    else:
+        await add_water_log(session, water_row, target_date)
+    await update_cached_progress(
+        user.id, target_date, "HINCRBYFLOAT", water_drank=water
+    )
+    return water_row
+
+
+async def set_timezone(session, telegram_id: int, user, timezone: str):
+    if not TIMEZONE_INPUT_PATTERN.match(timezone):
+        raise ValidationError("invalid_timezone")
+    await update_user_settings(session, telegram_id, user.id, timezone=timezone)
+
+
+async def set_language(session, telegram_id: int, user, language: str):
+    if language not in translations:
+        raise ValidationError("set_language_usage")
+    await update_user_settings(session, telegram_id, user.id, language=language)
+
+
+async def iter_daily_log(session, user, target_date):
+    if write_behind:
+        await write_behind.flush()
+
+    start_datetime, end_datetime = get_day_bounds(user.timezone, target_date)
+    log_rows = await stream_log_entries(session, user.id, start_datetime, end_datetime)
+    async for rows in log_rows.partitions(LOG_BATCH_SIZE):
+        yield rows
+
+
+async def get_targets(session, user):
+    return await get_latest_info_log(session, user.id)
+
+
+async def count_users(session):
+    return await user_counter.get(session)
+
+
+async def get_progress(session, user, target_date):
+    progress = await get_cached_progress(user.id, target_date)
+    if progress:
+        return progress
+
+    version = await get_progress_version(user.id, target_date)
+    if write_behind:
+        await write_behind.flush()
+
+    start_datetime, end_datetime = get_day_bounds(user.timezone, target_date)
+    info_log = await get_latest_info_log(session, user.id, start_datetime, end_datetime)
+    if not info_log:
+        return None
+
+    daily_summary = await get_daily_summary(session, user.id, target_date)
+    if not daily_summary:
+        return None
+
+    progress = {
+        "calories_total": info_log.calories,
+        "protein_total": info_log.protein,
+        "fat_total": info_log.fat,
+        "carbs_total": info_log.carbohydrates,
+        "water_total": info_log.water,
+        "calories_eaten": daily_summary.total_calories,
+        "protein_eaten": daily_summary.total_protein,
+        "fat_eaten": daily_summary.total_fat,
+        "carbs_eaten": daily_summary.total_carbohydrates,
+        "water_drank": daily_summary.total_water,
+    }
+    if version is not None:
+        await cache_progress(user.id, target_date, progress, version)
+    return progress
+
+
+def get_remaining(progress: dict):
+    return {
+        "calories_remaining": max(
+            0, progress["calories_total"] - progress["calories_eaten"]
+        ),
+        "protein_remaining": max(
+            0, progress["protein_total"] - progress["protein_eaten"]
+        ),
+        "fat_remaining": max(0, progress["fat_total"] - progress["fat_eaten"]),
+        "carbs_remaining": max(0, progress["carbs_total"] - progress["carbs_eaten"]),
+        "water_remaining": max(0, progress["water_total"] - progress["water_drank"]),
+    }
+
+
+async def get_stats(session, user, period: str = "week"):
+    if period not in ROLLUPS:
+        raise ValidationError("stats_usage")
+
+    if write_behind:
+        await write_behind.flush()
+
+    today = get_local_date(get_utc_now(), user.timezone)
+    rollup = await get_rollup(session, period, user.id, today)
+    if not rollup:
+        return None
+
+    _, start_column, _ = ROLLUPS[period]
+    start = getattr(rollup, start_column.key)
+    days = (today - start).days + 1
+    return {
+        "period": period,
+        "start": start,
+        "calories": rollup.total_calories,
+        "protein": rollup.total_protein,
+        "fat": rollup.total_fat,
+        "carbohydrates": rollup.total_carbohydrates,
+        "water": rollup.total_water,
+        "calories_per_day": rollup.total_calories / days,
+        "water_per_day": rollup.total_water / days,
+    }
+
+
+async def reset_progress(session, user):
+    if write_behind:
+        await write_behind.flush()
+
+    current_time = get_utc_now()
+    target_date = get_local_date(current_time, user.timezone)
+    start_datetime, end_datetime = get_day_bounds(user.timezone, target_date)
+
+    await delete_day(
+        session, user.id, target_date, current_time, start_datetime, end_datetime
+    )
+    await invalidate_cached_progress(user.id, target_date)
+    return target_date
+
+
+def start_background_tasks():
+    if write_behind:
+        write_behind.start()
+    user_counter.start()
+
+
+async def stop_background_tasks():
+    if write_behind:
+        await write_behind.stop()
+    await user_counter.stop()
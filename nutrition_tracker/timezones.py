@@ -0,0 +1,69 @@
+import re
+import logging
+from datetime import datetime, time
+from functools import lru_cache
+import pytz
+
+logger = logging.getLogger(__name__)
+
+
+def get_utc_now():
+    return datetime.now(pytz.utc)
+
+
+TIMEZONE_PATTERN = re.compile(r"^UTC([+-])(\d{2})(?::(\d{2}))?$")
+TIMEZONE_INPUT_PATTERN = re.compile(r"^UTC([+-]\d{2}(?::\d{2})?)?$")
+
+
+@lru_cache(maxsize=1024)
+def get_user_timezone(timezone_str: str):
+    excluded_timezones = ["UTC", "UTC+00", "UTC-00"]
+    if timezone_str in excluded_timezones:
+        return pytz.utc
+    elif timezone_str.startswith("UTC"):
+        try:
+            match = TIMEZONE_PATTERN.match(timezone_str)
+            if not match:
+                raise ValueError("Invalid timezone format.")
+
+            sign, hours, minutes = match.groups()
+            hours = int(hours)
+            minutes = int(minutes) if minutes else 0
+
+            if hours > 14 or minutes >= 60:
+                raise ValueError("Invalid timezone offset values.")
+
+            total_minutes = hours * 60 + minutes
+            if sign == "-":
+                total_minutes = -total_minutes
+
+            return pytz.FixedOffset(total_minutes)
+        except ValueError as e:
+            logger.debug(
+                f"Invalid timezone format: {timezone_str}. Error: {e}. Defaulting to UTC."
+            )
+            return pytz.utc
+    else:
+        logger.debug(f"Unsupported timezone format: {timezone_str}. Defaulting to UTC.")
+        return pytz.utc
+
+
+def convert_to_user_timezone(utc_time, timezone_str):
+    user_timezone = get_user_timezone(timezone_str)
+    return utc_time.astimezone(user_timezone)
+
+
+def get_local_date(utc_time, timezone_str):
+    return convert_to_user_timezone(utc_time, timezone_str).date()
+
+
+@lru_cache(maxsize=4096)
+def get_day_bounds(timezone_str: str, target_date):
+    user_timezone = get_user_timezone(timezone_str)
+    start_datetime = user_timezone.localize(
+        datetime.combine(target_date, time.min)
+    ).astimezone(pytz.utc)
+    end_datetime = user_timezone.localize(
+        datetime.combine(target_date, time.max)
+    ).astimezone(pytz.utc)
+    return start_datetime, end_datetime
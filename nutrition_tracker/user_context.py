@@ -0,0 +1,60 @@
+import logging
+from contextvars import ContextVar
+from aiogram import types
+from aiogram.dispatcher.handler import CancelHandler
+from aiogram.dispatcher.middlewares import BaseMiddleware
+from .cache import get_cached_user
+from .config import metrics_port
+from .database import async_session
+from .i18n import DEFAULT_LANGUAGE, get_translation
+from .repository import load_or_create_user
+
+if metrics_port:
+    from . import metrics
+
+logger = logging.getLogger(__name__)
+
+current_user = ContextVar("current_user", default=None)
+
+
+async def handle_error(message: types.Message):
+    if metrics_port:
+        metrics.mark_error()
+    user = current_user.get()
+    user_language = user.language if user else DEFAULT_LANGUAGE
+    await message.reply(get_translation(user_language, "error_occurred"))
+
+
+async def resolve_user(session, telegram_id: int):
+    user = await get_cached_user(telegram_id)
+    source = "cache"
+    if user is None:
+        user = await load_or_create_user(session, telegram_id)
+        source = "database"
+    logger.debug(f"Resolved user {telegram_id} from {source}")
+    if metrics_port:
+        metrics.count_user_lookup(source)
+    return user
+
+
+class UserContextMiddleware(BaseMiddleware):
+    async def on_process_message(self, message: types.Message, data: dict):
+        current_user.set(None)
+        session = async_session()
+        data["session"] = session
+        try:
+            user = await resolve_user(session, message.from_user.id)
+        except Exception as e:
+            logger.debug(f"Error resolving user {message.from_user.id}: {e}")
+            await handle_error(message)
+            raise CancelHandler()
+
+        current_user.set(user)
+        data["user"] = user
+
+    async def on_post_process_message(
+        self, message: types.Message, results, data: dict
+    ):
+        session = data.pop("session", None)
+        if session is not None:
+            await session.close()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from sqlalchemy import insert
+from .config import (
+    write_behind_batch_size,
+    write_behind_enabled,
+    write_behind_interval_ms,
+)
+from .database import get_db_session
+from .models import FoodLog, WaterLog
+from .repository import build_summary_upsert
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer:
+    def __init__(self, interval_ms: int, batch_size: int):
+        self.interval = interval_ms / 1000
+        self.batch_size = batch_size
+        self.food_rows = []
+        self.water_rows = []
+        self.summaries = {}
+        self.flush_lock = asyncio.Lock()
+        self.batch_full = asyncio.Event()
+        self.task = None
+
+    def add_food(self, row: dict, day):
+        self.food_rows.append(row)
+        self.add_to_summary(
+            row["user_id"],
+            day,
+            row["date"],
+            total_calories=row["calories"],
+            total_protein=row["protein"],
+            total_fat=row["fat"],
+            total_carbohydrates=row["carbohydrates"],
+        )
+
+    def add_water(self, row: dict, day):
+        self.water_rows.append(row)
+        self.add_to_summary(row["user_id"], day, row["date"], total_water=row["water"])
+
+    def add_to_summary(self, user_id: int, day, date, **totals):
+        summary = self.summaries.get((user_id, day))
+        if summary is None:
+            summary = {
+                "user_id": user_id,
+                "date": date,
+                "day": day,
+                "total_calories": 0.0,
+                "total_protein": 0.0,
+                "total_fat": 0.0,
+                "total_carbohydrates": 0.0,
+                "total_water": 0.0,
+            }
+            self.summaries[(user_id, day)] = summary
+        for field, value in totals.items():
+            summary[field] += value
+
+        if len(self.food_rows) + len(self.water_rows) >= self.batch_size:
+            self.batch_full.set()
+
+    async def flush(self):
+        async with self.flush_lock:
+            food_rows, self.food_rows = self.food_rows, []
+            water_rows, self.water_rows = self.water_rows, []
+            summaries, self.summaries = self.summaries, {}
+            self.batch_full.clear()
+            if not summaries:
+                return
+
+            try:
+                async with get_db_session() as session:
+                    if food_rows:
+                        await session.execute(insert(FoodLog), food_rows)
+                    if water_rows:
+                        await session.execute(insert(WaterLog), water_rows)
+                    await session.execute(
+                        build_summary_upsert(list(summaries.values()))
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed, will retry: {e}")
+                self.food_rows[:0] = food_rows
+                self.water_rows[:0] = water_rows
+                for key, summary in summaries.items():
+                    totals = {
+                        field: value
+                        for field, value in summary.items()
+                        if field.startswith("total_")
+                    }
+                    self.add_to_summary(*key, summary["date"], **totals)
+                return
+
+            logger.debug(
+                f"Flushed {len(food_rows)} food and {len(water_rows)} water entries."
+            )
+
+    async def run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.batch_full.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        await self.flush()
+
+
+write_behind = (
+    WriteBehindBuffer(write_behind_interval_ms, write_behind_batch_size)
+    if write_behind_enabled
+    else None
+)
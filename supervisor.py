@@ -0,0 +1,183 @@
+import os
+import time
+import signal
+import queue
+import asyncio
+import logging
+import multiprocessing
+from dotenv import load_dotenv
+
+load_dotenv()
+
+WORKER_COUNT = int(os.getenv("WORKER_COUNT") or os.cpu_count() or 1)
+WORKER_STATS_INTERVAL = int(os.getenv("WORKER_STATS_INTERVAL") or 60)
+MAX_RETRY_DELAY = 60
+
+logger = logging.getLogger("supervisor")
+
+
+def get_shard_key(update: dict):
+    for update_type in ("message", "edited_message", "callback_query"):
+        payload = update.get(update_type)
+        if payload and payload.get("from"):
+            return payload["from"]["id"]
+    return update["update_id"]
+
+
+async def run_in_order(previous, coroutine):
+    if previous is not None:
+        await asyncio.gather(previous, return_exceptions=True)
+    await coroutine
+
+
+async def process_updates(worker_id: int, update_queue):
+    from aiogram import Bot, Dispatcher, types
+    from nutrition_tracker.bot import bot
+    from nutrition_tracker.config import metrics_host, metrics_port
+    from nutrition_tracker.database import engine
+    from nutrition_tracker.handlers import dp
+    from nutrition_tracker.services import (
+        start_background_tasks,
+        stop_background_tasks,
+    )
+
+    Bot.set_current(bot)
+    Dispatcher.set_current(dp)
+    start_background_tasks()
+    if metrics_port:
+        from nutrition_tracker import metrics
+
+        metrics.start_server(metrics_port + worker_id, metrics_host)
+
+    loop = asyncio.get_running_loop()
+    pending = {}
+    processed = 0
+    last_report = time.monotonic()
+
+    def forget(shard_key, task):
+        if pending.get(shard_key) is task:
+            del pending[shard_key]
+
+    def count_processed(_):
+        nonlocal processed
+        processed += 1
+
+    while True:
+        try:
+            data = await loop.run_in_executor(None, update_queue.get, True, 1)
+        except queue.Empty:
+            data = {}
+
+        now = time.monotonic()
+        if now - last_report >= WORKER_STATS_INTERVAL:
+            logger.info(
+                f"Worker {worker_id}: {processed} updates in {now - last_report:.0f}s "
+                f"({processed / (now - last_report):.1f}/s), {len(pending)} users pending."
+            )
+            processed = 0
+            last_report = now
+
+        if data is None:
+            break
+        if not data:
+            continue
+
+        shard_key = get_shard_key(data)
+        update = types.Update(**data)
+        task = loop.create_task(
+            run_in_order(pending.get(shard_key), dp.process_update(update))
+        )
+        task.add_done_callback(count_processed)
+        task.add_done_callback(lambda t, key=shard_key: forget(key, t))
+        pending[shard_key] = task
+
+    if pending:
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+    await stop_background_tasks()
+    await engine.dispose()
+    await bot.session.close()
+
+
+def run_worker(worker_id: int, update_queue):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(process_updates(worker_id, update_queue))
+
+
+def start_worker(context, worker_id: int, update_queue):
+    worker = context.Process(
+        target=run_worker,
+        args=(worker_id, update_queue),
+        name=f"worker-{worker_id}",
+    )
+    worker.start()
+    return worker
+
+
+def restart_dead_workers(context, workers, update_queues):
+    for worker_id, worker in enumerate(workers):
+        if not worker.is_alive():
+            logger.warning(
+                f"Worker {worker_id} exited with code {worker.exitcode}, restarting it."
+            )
+            workers[worker_id] = start_worker(
+                context, worker_id, update_queues[worker_id]
+            )
+
+
+async def get_updates(bot, **kwargs):
+    delay = 1
+    while True:
+        try:
+            return await bot.get_updates(**kwargs)
+        except Exception as e:
+            logger.warning(f"Failed to get updates, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+
+
+async def poll_updates(context, workers, update_queues):
+    from nutrition_tracker.bot import bot
+    from nutrition_tracker.database import engine, init_db
+
+    await init_db()
+
+    updates = await get_updates(bot, offset=-1, timeout=0)
+    offset = updates[-1].update_id + 1 if updates else None
+
+    try:
+        while True:
+            restart_dead_workers(context, workers, update_queues)
+            updates = await get_updates(bot, offset=offset, timeout=20)
+            for update in updates:
+                offset = update.update_id + 1
+                data = update.to_python()
+                update_queues[get_shard_key(data) % len(update_queues)].put(data)
+    finally:
+        await engine.dispose()
+        await bot.session.close()
+
+
+def run_supervisor(worker_count: int = WORKER_COUNT):
+    logging.basicConfig(level=logging.INFO)
+    context = multiprocessing.get_context("spawn")
+    update_queues = [context.Queue() for _ in range(worker_count)]
+    workers = [
+        start_worker(context, worker_id, update_queue)
+        for worker_id, update_queue in enumerate(update_queues)
+    ]
+    logger.info(f"Started {worker_count} workers.")
+
+    try:
+        asyncio.run(poll_updates(context, workers, update_queues))
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for update_queue in update_queues:
+            update_queue.put(None)
+        for worker in workers:
+            worker.join()
+        logger.info("All workers stopped.")
+
+
+if __name__ == "__main__":
+    run_supervisor()
@@ -0,0 +1,323 @@
+import os
+from datetime import datetime, timezone
+import psycopg2
+from dotenv import load_dotenv
+from nutrition_tracker.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    build_upcoming_partitions_ddl,
+    format_bound,
+)
+from nutrition_tracker.schema import SCHEMA_VERSION
+
+load_dotenv()
+
+DB_USER = os.getenv("DB_USER")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+DB_NAME = os.getenv("DB_NAME")
+DB_HOST = os.getenv("DB_HOST")
+DB_PORT = os.getenv("DB_PORT")
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD") or 3)
+UPGRADE_BATCH_SIZE = int(os.getenv("UPGRADE_BATCH_SIZE") or 5000)
+
+INDEXES = [
+    ("ix_info_log_user_id_date", "info_log", "user_id, date"),
+    ("ix_food_log_user_id_date", "food_log", "user_id, date"),
+    ("ix_water_log_user_id_date", "water_log", "user_id, date"),
+]
+
+USER_OFFSET_SQL = """
+    CASE
+        WHEN u.timezone ~ '^UTC[+-](0[0-9]|1[0-4])$'
+            THEN (substring(u.timezone FROM 4) || ':00')::interval
+        WHEN u.timezone ~ '^UTC[+-](0[0-9]|1[0-4]):[0-5][0-9]$'
+            THEN substring(u.timezone FROM 4)::interval
+        ELSE interval '0'
+    END
+"""
+
+
+def get_connection():
+    psycopg2_conn_params = {
+        "dbname": DB_NAME,
+        "user": DB_USER,
+        "host": DB_HOST,
+        "port": DB_PORT,
+    }
+
+    if DB_PASSWORD:
+        psycopg2_conn_params["password"] = DB_PASSWORD
+
+    conn = psycopg2.connect(**psycopg2_conn_params)
+    conn.autocommit = True
+    return conn
+
+
+def drop_invalid_index(cursor, index_name):
+    cursor.execute(
+        "SELECT i.indisvalid FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = %s",
+        (index_name,),
+    )
+    row = cursor.fetchone()
+    if row and not row[0]:
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        print(f"Dropped invalid index {index_name} left by an interrupted build.")
+
+
+def is_partitioned(cursor, table_name):
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+        (table_name,),
+    )
+    return cursor.fetchone() is not None
+
+
+def create_indexes(cursor):
+    for index_name, table_name, columns in INDEXES:
+        if is_partitioned(cursor, table_name):
+            continue
+        drop_invalid_index(cursor, index_name)
+        cursor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+            f"ON {table_name} ({columns})"
+        )
+        print(f"Index {index_name} on {table_name} is ready.")
+
+
+def add_daily_summary_day(cursor):
+    cursor.execute("ALTER TABLE daily_summary ADD COLUMN IF NOT EXISTS day DATE")
+
+    cursor.execute("SELECT min(id), max(id) FROM daily_summary WHERE day IS NULL")
+    min_id, max_id = cursor.fetchone()
+    backfilled = 0
+    if min_id is not None:
+        for low in range(min_id, max_id + 1, UPGRADE_BATCH_SIZE):
+            cursor.execute(
+                f"""
+                UPDATE daily_summary ds
+                SET day = ((ds.date AT TIME ZONE 'UTC') + {USER_OFFSET_SQL})::date
+                FROM users u
+                WHERE u.id = ds.user_id AND ds.day IS NULL
+                  AND ds.id >= %s AND ds.id < %s
+                """,
+                (low, low + UPGRADE_BATCH_SIZE),
+            )
+            backfilled += cursor.rowcount
+    print(f"Backfilled day for {backfilled} daily summaries.")
+
+    cursor.execute(
+        """
+        WITH merged AS (
+            SELECT user_id, day, min(id) AS keep_id,
+                   sum(total_calories) AS total_calories,
+                   sum(total_protein) AS total_protein,
+                   sum(total_fat) AS total_fat,
+                   sum(total_carbohydrates) AS total_carbohydrates,
+                   sum(total_water) AS total_water
+            FROM daily_summary
+            GROUP BY user_id, day
+            HAVING count(*) > 1
+        ),
+        kept AS (
+            UPDATE daily_summary ds
+            SET total_calories = m.total_calories,
+                total_protein = m.total_protein,
+                total_fat = m.total_fat,
+                total_carbohydrates = m.total_carbohydrates,
+                total_water = m.total_water
+            FROM merged m
+            WHERE ds.id = m.keep_id
+        )
+        DELETE FROM daily_summary ds
+        USING merged m
+        WHERE ds.user_id = m.user_id AND ds.day = m.day AND ds.id <> m.keep_id
+        """
+    )
+    print(f"Merged {cursor.rowcount} duplicate daily summaries.")
+
+    drop_invalid_index(cursor, "uq_daily_summary_user_id_day")
+    cursor.execute(
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_daily_summary_user_id_day "
+        "ON daily_summary (user_id, day)"
+    )
+    cursor.execute(
+        "SELECT 1 FROM pg_constraint WHERE conname = 'uq_daily_summary_user_id_day'"
+    )
+    if not cursor.fetchone():
+        cursor.execute(
+            "ALTER TABLE daily_summary ADD CONSTRAINT uq_daily_summary_user_id_day "
+            "UNIQUE USING INDEX uq_daily_summary_user_id_day"
+        )
+    cursor.execute(
+        "SELECT attnotnull FROM pg_attribute "
+        "WHERE attrelid = 'daily_summary'::regclass AND attname = 'day'"
+    )
+    if not cursor.fetchone()[0]:
+        cursor.execute(
+            "ALTER TABLE daily_summary DROP CONSTRAINT IF EXISTS ck_daily_summary_day"
+        )
+        cursor.execute(
+            "ALTER TABLE daily_summary ADD CONSTRAINT ck_daily_summary_day "
+            "CHECK (day IS NOT NULL) NOT VALID"
+        )
+        cursor.execute(
+            "ALTER TABLE daily_summary VALIDATE CONSTRAINT ck_daily_summary_day"
+        )
+        cursor.execute("ALTER TABLE daily_summary ALTER COLUMN day SET NOT NULL")
+        cursor.execute("ALTER TABLE daily_summary DROP CONSTRAINT ck_daily_summary_day")
+    cursor.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_daily_summary_user_id_date")
+    print("Daily summaries are keyed by (user_id, day).")
+
+
+ROLLUP_TABLES = [
+    ("weekly_summary", "week_start", "week"),
+    ("monthly_summary", "month_start", "month"),
+]
+
+
+def create_rollup_tables(cursor):
+    for table_name, start_column, period in ROLLUP_TABLES:
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                id SERIAL PRIMARY KEY,
+                user_id INTEGER NOT NULL REFERENCES users (id),
+                {start_column} DATE NOT NULL,
+                total_calories FLOAT NOT NULL,
+                total_protein FLOAT NOT NULL,
+                total_fat FLOAT NOT NULL,
+                total_carbohydrates FLOAT NOT NULL,
+                total_water FLOAT NOT NULL,
+                CONSTRAINT uq_{table_name}_user_id_{start_column}
+                    UNIQUE (user_id, {start_column})
+            )
+            """
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {table_name} (
+                user_id, {start_column}, total_calories, total_protein,
+                total_fat, total_carbohydrates, total_water
+            )
+            SELECT user_id, date_trunc('{period}', day)::date,
+                   sum(total_calories), sum(total_protein), sum(total_fat),
+                   sum(total_carbohydrates), sum(total_water)
+            FROM daily_summary
+            GROUP BY user_id, date_trunc('{period}', day)
+            ON CONFLICT (user_id, {start_column}) DO UPDATE
+            SET total_calories = excluded.total_calories,
+                total_protein = excluded.total_protein,
+                total_fat = excluded.total_fat,
+                total_carbohydrates = excluded.total_carbohydrates,
+                total_water = excluded.total_water
+            """
+        )
+        print(f"Rebuilt {cursor.rowcount} rows of {table_name}.")
+
+
+def partition_log_table(cursor, table_name, legacy_bound):
+    if is_partitioned(cursor, table_name):
+        return
+
+    legacy_name = f"{table_name}_legacy"
+    drop_invalid_index(cursor, f"{legacy_name}_id_date")
+    cursor.execute(
+        f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {legacy_name}_id_date "
+        f"ON {table_name} (id, date)"
+    )
+    cursor.execute(
+        f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {legacy_name}_range"
+    )
+    cursor.execute(
+        f"ALTER TABLE {table_name} ADD CONSTRAINT {legacy_name}_range "
+        "CHECK (date < %s) NOT VALID",
+        (legacy_bound,),
+    )
+    cursor.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {legacy_name}_range")
+
+    cursor.execute("BEGIN")
+    cursor.execute(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE")
+    cursor.execute(f"ALTER TABLE {table_name} RENAME TO {legacy_name}")
+    cursor.execute(f"ALTER TABLE {legacy_name} DROP CONSTRAINT {table_name}_pkey")
+    cursor.execute(
+        f"ALTER TABLE {legacy_name} ADD CONSTRAINT {legacy_name}_pkey "
+        f"PRIMARY KEY USING INDEX {legacy_name}_id_date"
+    )
+    cursor.execute(
+        f"ALTER INDEX ix_{table_name}_user_id_date "
+        f"RENAME TO ix_{legacy_name}_user_id_date"
+    )
+    cursor.execute(
+        f"CREATE TABLE {table_name} (LIKE {legacy_name} INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (date)"
+    )
+    cursor.execute(
+        f"ALTER TABLE {table_name} "
+        f"ADD CONSTRAINT {table_name}_pkey PRIMARY KEY (id, date)"
+    )
+    cursor.execute(
+        f"ALTER TABLE {table_name} "
+        f"ADD CONSTRAINT {table_name}_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (id)"
+    )
+    cursor.execute(
+        f"CREATE INDEX ix_{table_name}_user_id_date ON {table_name} (user_id, date)"
+    )
+    cursor.execute(
+        f"ALTER TABLE {table_name} ATTACH PARTITION {legacy_name} "
+        "FOR VALUES FROM (MINVALUE) TO (%s)",
+        (legacy_bound,),
+    )
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", (legacy_name,))
+    sequence_name = cursor.fetchone()[0]
+    cursor.execute(f"ALTER SEQUENCE {sequence_name} OWNED BY {table_name}.id")
+    cursor.execute("COMMIT")
+    print(f"{table_name} is partitioned by month, older rows are in {legacy_name}.")
+
+
+def partition_log_tables(cursor):
+    current_month = datetime.now(timezone.utc).date().replace(day=1)
+    legacy_bound = format_bound(add_months(current_month, 1))
+    for table_name in PARTITIONED_TABLES:
+        partition_log_table(cursor, table_name, legacy_bound)
+
+
+def create_upcoming_partitions(cursor):
+    for ddl in build_upcoming_partitions_ddl(
+        datetime.now(timezone.utc).date(), PARTITION_MONTHS_AHEAD
+    ):
+        cursor.execute(ddl)
+    print(f"Partitions for the next {PARTITION_MONTHS_AHEAD} months are ready.")
+
+
+def record_schema_version(cursor):
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version INTEGER PRIMARY KEY, "
+        "applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+    )
+    cursor.execute(
+        "INSERT INTO schema_version (version) VALUES (%s) ON CONFLICT DO NOTHING",
+        (SCHEMA_VERSION,),
+    )
+    print(f"Schema version {SCHEMA_VERSION} recorded.")
+
+
+def upgrade_database():
+    conn = get_connection()
+    cursor = conn.cursor()
+    create_indexes(cursor)
+    add_daily_summary_day(cursor)
+    create_rollup_tables(cursor)
+    partition_log_tables(cursor)
+    create_upcoming_partitions(cursor)
+    record_schema_version(cursor)
+    cursor.close()
+    conn.close()
+    print("Database has been upgraded successfully.")
+
+
+if __name__ == "__main__":
+    upgrade_database()